@@ -1,13 +1,18 @@
 import sys
 import json
 import os
-from PyQt6.QtWidgets import (
-    QApplication, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
-    QLabel, QTextEdit, QFileDialog, QComboBox, QMessageBox,
-    QSplitter, QMainWindow, QToolBar, QStatusBar, QCheckBox
-)
-from PyQt6.QtCore import Qt, QSettings, QSize
-from PyQt6.QtGui import QPalette, QColor, QAction, QIcon, QFont
+import multiprocessing
+import argparse
+import heapq
+import struct
+import time
+import queue
+import threading
+import bisect
+import functools
+from collections import OrderedDict, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # USB descriptor type constants
 DEVICE_DESCRIPTOR = 0x01
@@ -19,10 +24,111 @@ HID_DESCRIPTOR = 0x21
 BOS_DESCRIPTOR = 0x0F
 IAD_DESCRIPTOR = 0x0B
 DFU_DESCRIPTOR = 0x21
+CS_INTERFACE_DESCRIPTOR = 0x24
+CS_ENDPOINT_DESCRIPTOR = 0x25
+SS_ENDPOINT_COMPANION_DESCRIPTOR = 0x30
 
-def parse_device_descriptor(data):
+# Output verbosity levels
+VERBOSITY_TERSE = "terse"      # One key=value line per descriptor
+VERBOSITY_NORMAL = "normal"    # Decoded fields without notes
+VERBOSITY_EXPLAIN = "explain"  # Decoded fields plus Packetry notes
+VERBOSITY_LEVELS = (VERBOSITY_TERSE, VERBOSITY_NORMAL, VERBOSITY_EXPLAIN)
+
+# Helpful notes for Cynthion/Packetry users, shown at the explain level.
+# These are built once here rather than on every decode.
+DEVICE_NOTE = "\nNote: These VID/PID values identify the device manufacturer and product. Look for these in Packetry to track your device."
+CONFIGURATION_NOTE = ("\nNote: In Packetry, the Configuration descriptor is typically sent after the Device descriptor during enumeration.\n"
+                      "The total length field indicates how large the full configuration is, including all interface and endpoint descriptors that follow.")
+STRING_NOTE = "\nNote: String descriptors are used to provide human-readable information. In Packetry, look for GetDescriptor(String) requests to see when the host requests these values."
+LANGID_NOTE = "\nNote: String descriptor 0 lists the languages the device's strings are available in. In Packetry, the host requests it before asking for any other string."
+INTERFACE_NOTE = "\nNote: Interface descriptors define the logical groups of endpoints. In Packetry, these follow the Configuration descriptor and define the function and purpose of the device."
+ENDPOINT_NOTES = {
+    1: "\nNote: Isochronous endpoints are used for streaming data like audio/video. They provide guaranteed bandwidth but no retry on errors.",
+    2: "\nNote: Bulk endpoints are used for large data transfers. In Packetry, look for data transactions using this endpoint number.",
+    3: "\nNote: Interrupt endpoints are used for time-critical but small data. Common for HID devices like keyboards/mice.",
+}
+HID_NOTE = "\nNote: HID descriptors are found in Human Interface Devices (keyboards, mice, etc). In Packetry, look for GetDescriptor(Report) requests that follow to get the full HID report format."
+IAD_NOTE = "\nNote: IADs group multiple interfaces together as a single function (like a webcam with both audio and video). In Packetry, these appear before the interfaces they reference."
+CDC_NOTE = "\nNote: CDC descriptors are used in Communication Device Class devices like USB-to-Serial adapters. In Packetry, these appear within the Interface descriptors they modify."
+BOS_NOTE = "\nNote: The BOS (Binary Device Object Store) descriptor is a USB 3.0+ feature that describes device capabilities. In Packetry, look for this after device enumeration on USB 3.0+ devices."
+DFU_NOTE = "\nNote: DFU (Device Firmware Upgrade) descriptors indicate the device can be reprogrammed. In Packetry, these appear within Interface descriptors for programmable devices."
+
+def _compile_terse_formatter(label, fields):
+    """
+    Build a formatter that renders a descriptor as one key=value line.
+    fields is a sequence of (name, struct code, format spec) tuples laid out
+    in descriptor order; the struct and format string are compiled once.
+    """
+    layout = struct.Struct("<" + "".join(code for _, code, _ in fields))
+    template = label + " " + " ".join(f"{name}={{:{spec}}}" for name, _, spec in fields)
+    unpack_from = layout.unpack_from
+    
+    def format_terse(data):
+        return template.format(*unpack_from(data))
+    return format_terse
+
+def _format_string_terse(data):
+    try:
+        decoded = bytes(data[2:data[0]]).decode('utf-16-le')
+    except Exception:
+        decoded = "<decode error>"
+    return f"STRING bLength={data[0]} bDescriptorType={data[1]} string={json.dumps(decoded)}"
+
+# Field layouts for terse output, per descriptor type
+TERSE_FIELDS = {
+    "DEVICE": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bcdUSB", "H", "#06x"),
+        ("bDeviceClass", "B", "d"), ("bDeviceSubClass", "B", "d"), ("bDeviceProtocol", "B", "d"),
+        ("bMaxPacketSize0", "B", "d"), ("idVendor", "H", "#06x"), ("idProduct", "H", "#06x"),
+        ("bcdDevice", "H", "#06x"), ("iManufacturer", "B", "d"), ("iProduct", "B", "d"),
+        ("iSerialNumber", "B", "d"), ("bNumConfigurations", "B", "d"),
+    ),
+    "CONFIGURATION": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("wTotalLength", "H", "d"),
+        ("bNumInterfaces", "B", "d"), ("bConfigurationValue", "B", "d"), ("iConfiguration", "B", "d"),
+        ("bmAttributes", "B", "#04x"), ("bMaxPower", "B", "d"),
+    ),
+    "INTERFACE": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bInterfaceNumber", "B", "d"),
+        ("bAlternateSetting", "B", "d"), ("bNumEndpoints", "B", "d"), ("bInterfaceClass", "B", "d"),
+        ("bInterfaceSubClass", "B", "d"), ("bInterfaceProtocol", "B", "d"), ("iInterface", "B", "d"),
+    ),
+    "ENDPOINT": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bEndpointAddress", "B", "#04x"),
+        ("bmAttributes", "B", "#04x"), ("wMaxPacketSize", "H", "d"), ("bInterval", "B", "d"),
+    ),
+    "HID": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bcdHID", "H", "#06x"),
+        ("bCountryCode", "B", "d"), ("bNumDescriptors", "B", "d"), ("bClassDescriptorType", "B", "d"),
+        ("wDescriptorLength", "H", "d"),
+    ),
+    "INTERFACE_ASSOCIATION": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bFirstInterface", "B", "d"),
+        ("bInterfaceCount", "B", "d"), ("bFunctionClass", "B", "d"), ("bFunctionSubClass", "B", "d"),
+        ("bFunctionProtocol", "B", "d"), ("iFunction", "B", "d"),
+    ),
+    "CS_INTERFACE": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bDescriptorSubtype", "B", "d"),
+    ),
+    "BOS": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("wTotalLength", "H", "d"),
+        ("bNumDeviceCaps", "B", "d"),
+    ),
+    "DFU_FUNCTIONAL": (
+        ("bLength", "B", "d"), ("bDescriptorType", "B", "d"), ("bmAttributes", "B", "#04x"),
+        ("wDetachTimeOut", "H", "d"), ("wTransferSize", "H", "d"), ("bcdDFUVersion", "H", "#06x"),
+    ),
+}
+
+TERSE_FORMATTERS = {label: _compile_terse_formatter(label, fields) for label, fields in TERSE_FIELDS.items()}
+TERSE_FORMATTERS["STRING"] = _format_string_terse
+
+def parse_device_descriptor(data, verbosity=VERBOSITY_EXPLAIN, strings=None):
     if len(data) < 18:
         raise ValueError("Device Descriptor requires at least 18 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["DEVICE"](data) + _format_strings_terse(
+            strings, (("manufacturer", data[14]), ("product", data[15]), ("serial", data[16])))
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
     output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} (DEVICE descriptor)")
@@ -51,20 +157,22 @@ def parse_device_descriptor(data):
         output.append(f"* {data[10]:02X} {data[11]:02X} → `idProduct` = 0x{data[11]:02X}{data[10]:02X}")
     
     output.append(f"* {data[12]:02X} {data[13]:02X} → `bcdDevice` = {data[13]}.{data[12]}")
-    output.append(f"* {data[14]:02X} → `iManufacturer` = {data[14]} (String descriptor index)")
-    output.append(f"* {data[15]:02X} → `iProduct` = {data[15]} (String descriptor index)")
-    output.append(f"* {data[16]:02X} → `iSerialNumber` = {data[16]} (String descriptor index)")
+    output.append(f"* {data[14]:02X} → `iManufacturer` = {data[14]} ({describe_string_index(data[14], strings)})")
+    output.append(f"* {data[15]:02X} → `iProduct` = {data[15]} ({describe_string_index(data[15], strings)})")
+    output.append(f"* {data[16]:02X} → `iSerialNumber` = {data[16]} ({describe_string_index(data[16], strings)})")
     output.append(f"* {data[17]:02X} → `bNumConfigurations` = {data[17]}")
     
     # Add helpful notes for Cynthion/Packetry users
-    if vendor_id and product_id:
-        output.append("\nNote: These VID/PID values identify the device manufacturer and product. Look for these in Packetry to track your device.")
+    if verbosity == VERBOSITY_EXPLAIN and vendor_id and product_id:
+        output.append(DEVICE_NOTE)
     
     return "\n".join(output)
 
-def parse_configuration_descriptor(data):
+def parse_configuration_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 9:
         raise ValueError("Configuration Descriptor requires at least 9 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["CONFIGURATION"](data)
     output = []
     total_length = data[2] | (data[3] << 8)
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
@@ -88,14 +196,19 @@ def parse_configuration_descriptor(data):
     output.append(f"* {data[8]:02X} → `bMaxPower` = {data[8]*2} mA")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: In Packetry, the Configuration descriptor is typically sent after the Device descriptor during enumeration.")
-    output.append("The total length field indicates how large the full configuration is, including all interface and endpoint descriptors that follow.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(CONFIGURATION_NOTE)
     
     return "\n".join(output)
 
-def parse_string_descriptor(data):
+def parse_string_descriptor(data, verbosity=VERBOSITY_EXPLAIN, string_index=None):
     if len(data) < 2:
         raise ValueError("String Descriptor requires at least 2 bytes")
+    # String index 0 holds the supported LANGIDs rather than text
+    if string_index == 0:
+        return parse_langid_descriptor(data, verbosity)
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["STRING"](data)
     try:
         decoded = data[2:data[0]].decode('utf-16-le')
     except Exception:
@@ -106,13 +219,35 @@ def parse_string_descriptor(data):
     output.append(f"* Decoded String → \"{decoded}\"")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: String descriptors are used to provide human-readable information. In Packetry, look for GetDescriptor(String) requests to see when the host requests these values.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(STRING_NOTE)
     
     return "\n".join(output)
 
-def parse_interface_descriptor(data):
+def parse_langid_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
+    if len(data) < 2:
+        raise ValueError("LANGID Descriptor requires at least 2 bytes")
+    end = min(data[0], len(data))
+    langids = [data[i] | (data[i + 1] << 8) for i in range(2, end - 1, 2)]
+    if verbosity == VERBOSITY_TERSE:
+        return f"LANGID bLength={data[0]} bDescriptorType={data[1]} wLANGID=" + ",".join(f"{langid:#06x}" for langid in langids)
+    output = []
+    output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
+    output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} (STRING descriptor, index 0: LANGID array)")
+    for i, langid in enumerate(langids):
+        output.append(f"* {langid & 0xFF:02X} {langid >> 8:02X} → `wLANGID[{i}]` = 0x{langid:04X} ({get_language_name(langid)})")
+    
+    # Add helpful notes for Cynthion/Packetry users
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(LANGID_NOTE)
+    
+    return "\n".join(output)
+
+def parse_interface_descriptor(data, verbosity=VERBOSITY_EXPLAIN, strings=None):
     if len(data) < 9:
         raise ValueError("Interface Descriptor requires at least 9 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["INTERFACE"](data) + _format_strings_terse(strings, (("interface", data[8]),))
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
     output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} (INTERFACE descriptor)")
@@ -133,16 +268,19 @@ def parse_interface_descriptor(data):
     protocol_name = get_interface_protocol_name(class_code, data[6], data[7])
     output.append(f"* {data[7]:02X} → `bInterfaceProtocol` = {data[7]} ({protocol_name})")
     
-    output.append(f"* {data[8]:02X} → `iInterface` = {data[8]} (String descriptor index)")
+    output.append(f"* {data[8]:02X} → `iInterface` = {data[8]} ({describe_string_index(data[8], strings)})")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: Interface descriptors define the logical groups of endpoints. In Packetry, these follow the Configuration descriptor and define the function and purpose of the device.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(INTERFACE_NOTE)
     
     return "\n".join(output)
 
-def parse_endpoint_descriptor(data):
+def parse_endpoint_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 7:
         raise ValueError("Endpoint Descriptor requires at least 7 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["ENDPOINT"](data)
     wMaxPacketSize = data[4] | (data[5] << 8)
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
@@ -155,8 +293,7 @@ def parse_endpoint_descriptor(data):
     
     # Decode attributes
     transfer_type = data[3] & 0x03
-    transfer_types = {0: "Control", 1: "Isochronous", 2: "Bulk", 3: "Interrupt"}
-    transfer_type_name = transfer_types.get(transfer_type, "Unknown")
+    transfer_type_name = get_transfer_type_name(transfer_type)
     
     sync_type = (data[3] & 0x0C) >> 2
     sync_types = {0: "No Sync", 1: "Asynchronous", 2: "Adaptive", 3: "Synchronous"}
@@ -185,18 +322,16 @@ def parse_endpoint_descriptor(data):
     output.append(f"* {data[6]:02X} → `bInterval` = {data[6]} ({interval_desc})")
     
     # Add helpful notes for Cynthion/Packetry users
-    if transfer_type == 2:  # Bulk
-        output.append("\nNote: Bulk endpoints are used for large data transfers. In Packetry, look for data transactions using this endpoint number.")
-    elif transfer_type == 3:  # Interrupt
-        output.append("\nNote: Interrupt endpoints are used for time-critical but small data. Common for HID devices like keyboards/mice.")
-    elif transfer_type == 1:  # Isochronous
-        output.append("\nNote: Isochronous endpoints are used for streaming data like audio/video. They provide guaranteed bandwidth but no retry on errors.")
+    if verbosity == VERBOSITY_EXPLAIN and transfer_type in ENDPOINT_NOTES:
+        output.append(ENDPOINT_NOTES[transfer_type])
     
     return "\n".join(output)
 
-def parse_hid_descriptor(data):
+def parse_hid_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 9:
         raise ValueError("HID Descriptor requires at least 9 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["HID"](data)
     wDescriptorLength = data[7] | (data[8] << 8)
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
@@ -250,13 +385,16 @@ def parse_hid_descriptor(data):
     output.append(f"* {data[7]:02X} {data[8]:02X} → `wDescriptorLength` = {wDescriptorLength} bytes")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: HID descriptors are found in Human Interface Devices (keyboards, mice, etc). In Packetry, look for GetDescriptor(Report) requests that follow to get the full HID report format.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(HID_NOTE)
     
     return "\n".join(output)
 
-def parse_interface_association_descriptor(data):
+def parse_interface_association_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 8:
         raise ValueError("Interface Association Descriptor requires at least 8 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["INTERFACE_ASSOCIATION"](data)
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
     output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} (INTERFACE ASSOCIATION descriptor)")
@@ -271,13 +409,16 @@ def parse_interface_association_descriptor(data):
     output.append(f"* {data[7]:02X} → `iFunction` = {data[7]} (String descriptor index)")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: IADs group multiple interfaces together as a single function (like a webcam with both audio and video). In Packetry, these appear before the interfaces they reference.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(IAD_NOTE)
     
     return "\n".join(output)
 
-def parse_cdc_interface_descriptor(data):
+def parse_cdc_interface_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 5:
         raise ValueError("CDC Interface Descriptor requires at least 5 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["CS_INTERFACE"](data)
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
     output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} (CS_INTERFACE descriptor)")
@@ -332,13 +473,16 @@ def parse_cdc_interface_descriptor(data):
             output.append(f"* {data[i]:02X} → `bSubordinateInterface{i-4}` = {data[i]}")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: CDC descriptors are used in Communication Device Class devices like USB-to-Serial adapters. In Packetry, these appear within the Interface descriptors they modify.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(CDC_NOTE)
     
     return "\n".join(output)
 
-def parse_bos_descriptor(data):
+def parse_bos_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 5:
         raise ValueError("BOS Descriptor requires at least 5 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["BOS"](data)
     total_length = data[2] | (data[3] << 8)
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
@@ -347,13 +491,16 @@ def parse_bos_descriptor(data):
     output.append(f"* {data[4]:02X} → `bNumDeviceCaps` = {data[4]}")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: The BOS (Binary Device Object Store) descriptor is a USB 3.0+ feature that describes device capabilities. In Packetry, look for this after device enumeration on USB 3.0+ devices.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(BOS_NOTE)
     
     return "\n".join(output)
 
-def parse_dfu_functional_descriptor(data):
+def parse_dfu_functional_descriptor(data, verbosity=VERBOSITY_EXPLAIN):
     if len(data) < 9:
         raise ValueError("DFU Functional Descriptor requires at least 9 bytes")
+    if verbosity == VERBOSITY_TERSE:
+        return TERSE_FORMATTERS["DFU_FUNCTIONAL"](data)
     output = []
     output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
     output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} (DFU FUNCTIONAL descriptor)")
@@ -378,10 +525,297 @@ def parse_dfu_functional_descriptor(data):
     output.append(f"* {data[7]:02X} {data[8]:02X} → `bcdDFUVersion` = {data[8]:02X}.{data[7]:02X}")
     
     # Add helpful notes for Cynthion/Packetry users
-    output.append("\nNote: DFU (Device Firmware Upgrade) descriptors indicate the device can be reprogrammed. In Packetry, these appear within Interface descriptors for programmable devices.")
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(DFU_NOTE)
+    
+    return "\n".join(output)
+
+# Class-specific layouts, per bDescriptorSubtype: (subtype name, fields). Each
+# field is (name, size, kind) and fields follow each other from offset 3. A
+# size given as a field name is an element count read from that earlier field.
+UVC_VC_LAYOUTS = {
+    0x01: ("VC_HEADER", (("bcdUVC", 2, "bcd"), ("wTotalLength", 2, "bytes"), ("dwClockFrequency", 4, "hz"),
+                         ("bInCollection", 1, "u"), ("baInterfaceNr", "bInCollection", "array"))),
+    0x02: ("VC_INPUT_TERMINAL", (("bTerminalID", 1, "u"), ("wTerminalType", 2, "video_terminal"),
+                                 ("bAssocTerminal", 1, "u"), ("iTerminal", 1, "str"),
+                                 # Camera terminals only
+                                 ("wObjectiveFocalLengthMin", 2, "u"), ("wObjectiveFocalLengthMax", 2, "u"),
+                                 ("wOcularFocalLength", 2, "u"), ("bControlSize", 1, "u"),
+                                 ("bmControls", "bControlSize", "bitmap"))),
+    0x03: ("VC_OUTPUT_TERMINAL", (("bTerminalID", 1, "u"), ("wTerminalType", 2, "video_terminal"),
+                                  ("bAssocTerminal", 1, "u"), ("bSourceID", 1, "u"), ("iTerminal", 1, "str"))),
+    0x04: ("VC_SELECTOR_UNIT", (("bUnitID", 1, "u"), ("bNrInPins", 1, "u"), ("baSourceID", "bNrInPins", "array"),
+                                ("iSelector", 1, "str"))),
+    0x05: ("VC_PROCESSING_UNIT", (("bUnitID", 1, "u"), ("bSourceID", 1, "u"), ("wMaxMultiplier", 2, "u"),
+                                  ("bControlSize", 1, "u"), ("bmControls", "bControlSize", "bitmap"),
+                                  ("iProcessing", 1, "str"), ("bmVideoStandards", 1, "hex"))),
+    0x06: ("VC_EXTENSION_UNIT", (("bUnitID", 1, "u"), ("guidExtensionCode", 16, "guid"), ("bNumControls", 1, "u"),
+                                 ("bNrInPins", 1, "u"), ("baSourceID", "bNrInPins", "array"),
+                                 ("bControlSize", 1, "u"), ("bmControls", "bControlSize", "bitmap"),
+                                 ("iExtension", 1, "str"))),
+    0x07: ("VC_ENCODING_UNIT", (("bUnitID", 1, "u"), ("bSourceID", 1, "u"), ("iEncoding", 1, "str"))),
+}
+
+_UVC_FRAME_FIELDS = (("bFrameIndex", 1, "u"), ("bmCapabilities", 1, "hex"), ("wWidth", 2, "u"), ("wHeight", 2, "u"),
+                     ("dwMinBitRate", 4, "bps"), ("dwMaxBitRate", 4, "bps"),
+                     ("dwMaxVideoFrameBufferSize", 4, "bytes"), ("dwDefaultFrameInterval", 4, "interval"),
+                     ("bFrameIntervalType", 1, "u"), ("dwFrameInterval", "bFrameIntervalType", "intervals"))
+
+UVC_VS_LAYOUTS = {
+    0x01: ("VS_INPUT_HEADER", (("bNumFormats", 1, "u"), ("wTotalLength", 2, "bytes"), ("bEndpointAddress", 1, "hex"),
+                               ("bmInfo", 1, "hex"), ("bTerminalLink", 1, "u"), ("bStillCaptureMethod", 1, "u"),
+                               ("bTriggerSupport", 1, "u"), ("bTriggerUsage", 1, "u"), ("bControlSize", 1, "u"),
+                               ("bmaControls", None, "rest"))),
+    0x02: ("VS_OUTPUT_HEADER", (("bNumFormats", 1, "u"), ("wTotalLength", 2, "bytes"), ("bEndpointAddress", 1, "hex"),
+                                ("bTerminalLink", 1, "u"), ("bControlSize", 1, "u"), ("bmaControls", None, "rest"))),
+    0x03: ("VS_STILL_IMAGE_FRAME", (("bEndpointAddress", 1, "hex"), ("bNumImageSizePatterns", 1, "u"),
+                                    ("waImageSizes", None, "rest"))),
+    0x04: ("VS_FORMAT_UNCOMPRESSED", (("bFormatIndex", 1, "u"), ("bNumFrameDescriptors", 1, "u"),
+                                      ("guidFormat", 16, "guid"), ("bBitsPerPixel", 1, "u"),
+                                      ("bDefaultFrameIndex", 1, "u"), ("bAspectRatioX", 1, "u"),
+                                      ("bAspectRatioY", 1, "u"), ("bmInterlaceFlags", 1, "hex"),
+                                      ("bCopyProtect", 1, "u"))),
+    0x05: ("VS_FRAME_UNCOMPRESSED", _UVC_FRAME_FIELDS),
+    0x06: ("VS_FORMAT_MJPEG", (("bFormatIndex", 1, "u"), ("bNumFrameDescriptors", 1, "u"), ("bmFlags", 1, "hex"),
+                               ("bDefaultFrameIndex", 1, "u"), ("bAspectRatioX", 1, "u"), ("bAspectRatioY", 1, "u"),
+                               ("bmInterlaceFlags", 1, "hex"), ("bCopyProtect", 1, "u"))),
+    0x07: ("VS_FRAME_MJPEG", _UVC_FRAME_FIELDS),
+    0x0D: ("VS_COLORFORMAT", (("bColorPrimaries", 1, "u"), ("bTransferCharacteristics", 1, "u"),
+                              ("bMatrixCoefficients", 1, "u"))),
+    0x10: ("VS_FORMAT_FRAME_BASED", (("bFormatIndex", 1, "u"), ("bNumFrameDescriptors", 1, "u"),
+                                     ("guidFormat", 16, "guid"), ("bBitsPerPixel", 1, "u"),
+                                     ("bDefaultFrameIndex", 1, "u"), ("bAspectRatioX", 1, "u"),
+                                     ("bAspectRatioY", 1, "u"), ("bmInterlaceFlags", 1, "hex"),
+                                     ("bCopyProtect", 1, "u"), ("bVariableSize", 1, "u"))),
+    0x11: ("VS_FRAME_FRAME_BASED", (("bFrameIndex", 1, "u"), ("bmCapabilities", 1, "hex"), ("wWidth", 2, "u"),
+                                    ("wHeight", 2, "u"), ("dwMinBitRate", 4, "bps"), ("dwMaxBitRate", 4, "bps"),
+                                    ("dwDefaultFrameInterval", 4, "interval"), ("bFrameIntervalType", 1, "u"),
+                                    ("dwBytesPerLine", 4, "bytes"),
+                                    ("dwFrameInterval", "bFrameIntervalType", "intervals"))),
+}
+
+UVC_ENDPOINT_LAYOUTS = {
+    0x03: ("EP_INTERRUPT", (("wMaxTransferSize", 2, "bytes"),)),
+}
+
+UAC1_AC_LAYOUTS = {
+    0x01: ("AC_HEADER", (("bcdADC", 2, "bcd"), ("wTotalLength", 2, "bytes"), ("bInCollection", 1, "u"),
+                         ("baInterfaceNr", "bInCollection", "array"))),
+    0x02: ("AC_INPUT_TERMINAL", (("bTerminalID", 1, "u"), ("wTerminalType", 2, "audio_terminal"),
+                                 ("bAssocTerminal", 1, "u"), ("bNrChannels", 1, "u"), ("wChannelConfig", 2, "hex"),
+                                 ("iChannelNames", 1, "str"), ("iTerminal", 1, "str"))),
+    0x03: ("AC_OUTPUT_TERMINAL", (("bTerminalID", 1, "u"), ("wTerminalType", 2, "audio_terminal"),
+                                  ("bAssocTerminal", 1, "u"), ("bSourceID", 1, "u"), ("iTerminal", 1, "str"))),
+    0x04: ("AC_MIXER_UNIT", (("bUnitID", 1, "u"), ("bNrInPins", 1, "u"), ("baSourceID", "bNrInPins", "array"),
+                             ("bmControls", None, "rest"))),
+    0x05: ("AC_SELECTOR_UNIT", (("bUnitID", 1, "u"), ("bNrInPins", 1, "u"), ("baSourceID", "bNrInPins", "array"),
+                                ("iSelector", 1, "str"))),
+    0x06: ("AC_FEATURE_UNIT", (("bUnitID", 1, "u"), ("bSourceID", 1, "u"), ("bControlSize", 1, "u"),
+                               ("bmaControls", None, "rest"))),
+}
+
+UAC1_AS_LAYOUTS = {
+    0x01: ("AS_GENERAL", (("bTerminalLink", 1, "u"), ("bDelay", 1, "u"), ("wFormatTag", 2, "format_tag"))),
+    0x02: ("AS_FORMAT_TYPE", (("bFormatType", 1, "u"), ("bNrChannels", 1, "u"), ("bSubframeSize", 1, "bytes"),
+                              ("bBitResolution", 1, "u"), ("bSamFreqType", 1, "u"),
+                              ("tSamFreq", "bSamFreqType", "sample_rates"))),
+}
+
+UAC2_AC_LAYOUTS = {
+    0x01: ("AC_HEADER", (("bcdADC", 2, "bcd"), ("bCategory", 1, "hex"), ("wTotalLength", 2, "bytes"),
+                         ("bmControls", 1, "hex"))),
+    0x02: ("AC_INPUT_TERMINAL", (("bTerminalID", 1, "u"), ("wTerminalType", 2, "audio_terminal"),
+                                 ("bAssocTerminal", 1, "u"), ("bCSourceID", 1, "u"), ("bNrChannels", 1, "u"),
+                                 ("bmChannelConfig", 4, "hex"), ("iChannelNames", 1, "str"),
+                                 ("bmControls", 2, "hex"), ("iTerminal", 1, "str"))),
+    0x03: ("AC_OUTPUT_TERMINAL", (("bTerminalID", 1, "u"), ("wTerminalType", 2, "audio_terminal"),
+                                  ("bAssocTerminal", 1, "u"), ("bSourceID", 1, "u"), ("bCSourceID", 1, "u"),
+                                  ("bmControls", 2, "hex"), ("iTerminal", 1, "str"))),
+    0x04: ("AC_MIXER_UNIT", (("bUnitID", 1, "u"), ("bNrInPins", 1, "u"), ("baSourceID", "bNrInPins", "array"),
+                             ("bmControls", None, "rest"))),
+    0x05: ("AC_SELECTOR_UNIT", (("bUnitID", 1, "u"), ("bNrInPins", 1, "u"), ("baSourceID", "bNrInPins", "array"),
+                                ("bmControls", 1, "hex"), ("iSelector", 1, "str"))),
+    0x06: ("AC_FEATURE_UNIT", (("bUnitID", 1, "u"), ("bSourceID", 1, "u"), ("bmaControls", None, "rest"))),
+    0x0A: ("AC_CLOCK_SOURCE", (("bClockID", 1, "u"), ("bmAttributes", 1, "hex"), ("bmControls", 1, "hex"),
+                               ("bAssocTerminal", 1, "u"), ("iClockSource", 1, "str"))),
+    0x0B: ("AC_CLOCK_SELECTOR", (("bClockID", 1, "u"), ("bNrInPins", 1, "u"),
+                                 ("baCSourceID", "bNrInPins", "array"), ("bmControls", 1, "hex"),
+                                 ("iClockSelector", 1, "str"))),
+    0x0C: ("AC_CLOCK_MULTIPLIER", (("bClockID", 1, "u"), ("bCSourceID", 1, "u"), ("bmControls", 1, "hex"),
+                                   ("iClockMultiplier", 1, "str"))),
+}
+
+UAC2_AS_LAYOUTS = {
+    0x01: ("AS_GENERAL", (("bTerminalLink", 1, "u"), ("bmControls", 1, "hex"), ("bFormatType", 1, "u"),
+                          ("bmFormats", 4, "hex"), ("bNrChannels", 1, "u"), ("bmChannelConfig", 4, "hex"),
+                          ("iChannelNames", 1, "str"))),
+    0x02: ("AS_FORMAT_TYPE", (("bFormatType", 1, "u"), ("bSubslotSize", 1, "bytes"), ("bBitResolution", 1, "u"))),
+}
+
+UAC1_ENDPOINT_LAYOUTS = {
+    0x01: ("EP_GENERAL", (("bmAttributes", 1, "hex"), ("bLockDelayUnits", 1, "u"), ("wLockDelay", 2, "u"))),
+}
+
+UAC2_ENDPOINT_LAYOUTS = {
+    0x01: ("EP_GENERAL", (("bmAttributes", 1, "hex"), ("bmControls", 1, "hex"), ("bLockDelayUnits", 1, "u"),
+                          ("wLockDelay", 2, "u"))),
+}
+
+# Element names of frame interval and sample rate lists given as a continuous range
+CONTINUOUS_RANGE_FIELDS = {
+    "intervals": ("dwMinFrameInterval", "dwMaxFrameInterval", "dwFrameIntervalStep"),
+    "sample_rates": ("tLowerSamFreq", "tUpperSamFreq"),
+}
+
+UVC_NOTE = "\nNote: UVC class-specific descriptors describe a video function's units, terminals and stream formats. In Packetry, they follow the VideoControl and VideoStreaming interface descriptors they belong to."
+UAC_NOTE = "\nNote: UAC class-specific descriptors describe an audio function's terminals, units and stream formats. In Packetry, they follow the AudioControl and AudioStreaming interface descriptors they belong to."
+
+def _guid_fourcc(raw):
+    """FourCC at the start of a stream format GUID (e.g. YUY2, NV12), or None"""
+    fourcc = bytes(raw[0:4])
+    if all(0x20 <= b < 0x7F for b in fourcc):
+        return fourcc.decode('ascii').strip()
+    return None
+
+def _format_guid(raw, with_fourcc=True):
+    guid = (f"{{{int.from_bytes(raw[0:4], 'little'):08X}-{int.from_bytes(raw[4:6], 'little'):04X}-"
+            f"{int.from_bytes(raw[6:8], 'little'):04X}-{raw[8:10].hex().upper()}-{raw[10:16].hex().upper()}}}")
+    fourcc = _guid_fourcc(raw) if with_fourcc else None
+    return f"{guid} ({fourcc})" if fourcc else guid
+
+def _format_class_field(name, kind, size, value, raw, strings):
+    if kind == "hex":
+        return f"0x{value:0{size * 2}X}"
+    if kind == "bcd":
+        return f"{value >> 8:02X}.{value & 0xFF:02X}"
+    if kind == "str":
+        return f"{value} ({describe_string_index(value, strings)})"
+    if kind == "bytes":
+        return f"{value} bytes"
+    if kind == "hz":
+        return f"{value} Hz"
+    if kind == "bps":
+        return f"{value} bps"
+    if kind == "guid":
+        return _format_guid(raw)
+    if kind == "intervals" and name == "dwFrameIntervalStep":
+        return f"{value} (100 ns units)"
+    if kind in ("interval", "intervals"):
+        # Frame intervals are in 100 ns units
+        return f"{value} ({10000000 / value:.2f} fps)" if value else "0"
+    if kind == "sample_rates":
+        return f"{value} Hz"
+    if kind == "video_terminal":
+        return f"0x{value:04X} ({get_video_terminal_type_name(value)})"
+    if kind == "audio_terminal":
+        return f"0x{value:04X} ({get_audio_terminal_type_name(value)})"
+    if kind == "format_tag":
+        return f"0x{value:04X} ({get_audio_format_tag_name(value)})"
+    return str(value)
+
+def _iter_class_fields(data, fields):
+    """
+    Walk a class-specific layout, yielding (name, offset, size, kind, value)
+    for each field element that fits inside bLength.
+    """
+    end = min(data[0], len(data))
+    offset = 3
+    values = {}
+    for name, size, kind in fields:
+        if kind == "rest":
+            if offset < end:
+                yield name, offset, end - offset, kind, None
+            return
+        
+        if kind in ("array", "bitmap", "intervals", "sample_rates"):
+            count = values.get(size, 0)
+            if kind == "bitmap":
+                # A bitmap is one field whose size comes from an earlier field
+                if offset + count > end:
+                    return
+                if count:
+                    value = int.from_bytes(data[offset:offset + count], 'little')
+                    yield name, offset, count, "hex", value
+                offset += count
+                continue
+            element_size = {"array": 1, "intervals": 4, "sample_rates": 3}[kind]
+            if count == 0 and kind in CONTINUOUS_RANGE_FIELDS:
+                # A count of 0 means a continuous range rather than a list
+                names = CONTINUOUS_RANGE_FIELDS[kind]
+            else:
+                names = [f"{name}[{i}]" for i in range(count)]
+            for element_name in names:
+                if offset + element_size > end:
+                    return
+                value = int.from_bytes(data[offset:offset + element_size], 'little')
+                yield element_name, offset, element_size, kind, value
+                offset += element_size
+            continue
+        
+        if offset + size > end:
+            return
+        value = int.from_bytes(data[offset:offset + size], 'little')
+        values[name] = value
+        yield name, offset, size, kind, value
+        offset += size
+
+def _parse_class_descriptor(data, verbosity, label, layouts, note, strings=None):
+    if len(data) < 3:
+        raise ValueError(f"{label} Class-Specific Descriptor requires at least 3 bytes")
+    type_name = "CS_ENDPOINT" if data[1] == CS_ENDPOINT_DESCRIPTOR else "CS_INTERFACE"
+    subtype_name, fields = layouts.get(data[2], ("Unknown", ()))
+    
+    if verbosity == VERBOSITY_TERSE:
+        parts = [f"{label}_{subtype_name} bLength={data[0]} bDescriptorType={data[1]} bDescriptorSubtype={data[2]}"]
+        for name, offset, size, kind, value in _iter_class_fields(data, fields):
+            if kind == "rest":
+                parts.append(f"{name}={bytes(data[offset:offset + size]).hex()}")
+            elif kind == "guid":
+                parts.append(f"{name}={_format_guid(data[offset:offset + size], with_fourcc=False)}")
+            elif kind in ("hex", "bcd", "video_terminal", "audio_terminal", "format_tag"):
+                parts.append(f"{name}=0x{value:0{size * 2}x}")
+            else:
+                parts.append(f"{name}={value}")
+        return " ".join(parts)
+    
+    output = []
+    output.append(f"* {data[0]:02X} → `bLength` = {data[0]} bytes")
+    output.append(f"* {data[1]:02X} → `bDescriptorType` = {data[1]} ({type_name} descriptor, {label})")
+    output.append(f"* {data[2]:02X} → `bDescriptorSubtype` = {data[2]} ({subtype_name})")
+    for name, offset, size, kind, value in _iter_class_fields(data, fields):
+        raw = data[offset:offset + size]
+        raw_text = " ".join(f"{b:02X}" for b in raw)
+        if kind == "rest":
+            output.append(f"* {raw_text} → `{name}` ({size} bytes)")
+        else:
+            output.append(f"* {raw_text} → `{name}` = {_format_class_field(name, kind, size, value, raw, strings)}")
+    
+    # Add helpful notes for Cynthion/Packetry users
+    if verbosity == VERBOSITY_EXPLAIN:
+        output.append(note)
     
     return "\n".join(output)
 
+def parse_uvc_descriptor(data, verbosity=VERBOSITY_EXPLAIN, interface_subclass=0x01, strings=None):
+    """Decode a UVC CS_INTERFACE or CS_ENDPOINT descriptor from a VideoControl (0x01) or VideoStreaming (0x02) interface"""
+    if len(data) >= 2 and data[1] == CS_ENDPOINT_DESCRIPTOR:
+        layouts = UVC_ENDPOINT_LAYOUTS
+    elif interface_subclass == 0x02:
+        layouts = UVC_VS_LAYOUTS
+    else:
+        layouts = UVC_VC_LAYOUTS
+    return _parse_class_descriptor(data, verbosity, "UVC", layouts, UVC_NOTE, strings)
+
+def parse_uac_descriptor(data, verbosity=VERBOSITY_EXPLAIN, interface_subclass=0x01, uac_version=1, strings=None):
+    """Decode a UAC 1 or 2 CS_INTERFACE or CS_ENDPOINT descriptor from an AudioControl (0x01) or AudioStreaming (0x02) interface"""
+    if len(data) >= 2 and data[1] == CS_ENDPOINT_DESCRIPTOR:
+        layouts = UAC2_ENDPOINT_LAYOUTS if uac_version == 2 else UAC1_ENDPOINT_LAYOUTS
+    elif interface_subclass == 0x02:
+        layouts = UAC2_AS_LAYOUTS if uac_version == 2 else UAC1_AS_LAYOUTS
+    else:
+        layouts = UAC2_AC_LAYOUTS if uac_version == 2 else UAC1_AC_LAYOUTS
+    return _parse_class_descriptor(data, verbosity, f"UAC{uac_version}", layouts, UAC_NOTE, strings)
+
 def get_device_class_name(class_code):
     classes = {
         0x00: "Use class information in the Interface Descriptors",
@@ -463,6 +897,24 @@ def get_interface_subclass_name(class_code, subclass_code):
         }
         return subclasses.get(subclass_code, "Unknown")
     
+    # Audio subclasses
+    elif class_code == 0x01:  # Audio
+        subclasses = {
+            0x01: "AudioControl",
+            0x02: "AudioStreaming",
+            0x03: "MIDIStreaming"
+        }
+        return subclasses.get(subclass_code, "Unknown")
+    
+    # Video subclasses
+    elif class_code == 0x0E:  # Video
+        subclasses = {
+            0x01: "VideoControl",
+            0x02: "VideoStreaming",
+            0x03: "Video Interface Collection"
+        }
+        return subclasses.get(subclass_code, "Unknown")
+    
     # For other classes, just return a generic response
     return f"Subclass {subclass_code:02X}"
 
@@ -486,9 +938,161 @@ def get_interface_protocol_name(class_code, subclass_code, protocol_code):
         }
         return protocols.get(protocol_code, "Unknown")
     
+    # Audio protocols
+    elif class_code == 0x01:  # Audio
+        protocols = {
+            0x00: "UAC 1.0",
+            0x20: "UAC 2.0",
+            0x30: "UAC 3.0"
+        }
+        return protocols.get(protocol_code, "Unknown")
+    
     # For other classes, just return a generic response
     return f"Protocol {protocol_code:02X}"
 
+def get_transfer_type_name(transfer_type):
+    transfer_types = {0: "Control", 1: "Isochronous", 2: "Bulk", 3: "Interrupt"}
+    return transfer_types.get(transfer_type, "Unknown")
+
+def get_video_terminal_type_name(terminal_type):
+    terminal_types = {
+        0x0100: "Vendor Specific",
+        0x0101: "USB Streaming",
+        0x0200: "Input Vendor Specific",
+        0x0201: "Camera Sensor",
+        0x0202: "Media Transport Input",
+        0x0300: "Output Vendor Specific",
+        0x0301: "Display",
+        0x0302: "Media Transport Output",
+        0x0400: "External Vendor Specific",
+        0x0401: "Composite Connector",
+        0x0402: "S-Video Connector",
+        0x0403: "Component Connector"
+    }
+    return terminal_types.get(terminal_type, "Unknown")
+
+def get_audio_terminal_type_name(terminal_type):
+    terminal_types = {
+        0x0100: "USB Undefined",
+        0x0101: "USB Streaming",
+        0x01FF: "USB Vendor Specific",
+        0x0200: "Input Undefined",
+        0x0201: "Microphone",
+        0x0202: "Desktop Microphone",
+        0x0203: "Personal Microphone",
+        0x0204: "Omni-directional Microphone",
+        0x0205: "Microphone Array",
+        0x0206: "Processing Microphone Array",
+        0x0300: "Output Undefined",
+        0x0301: "Speaker",
+        0x0302: "Headphones",
+        0x0303: "Head Mounted Display Audio",
+        0x0304: "Desktop Speaker",
+        0x0305: "Room Speaker",
+        0x0306: "Communication Speaker",
+        0x0307: "Low Frequency Effects Speaker",
+        0x0400: "Bi-directional Undefined",
+        0x0401: "Handset",
+        0x0402: "Headset",
+        0x0403: "Speakerphone",
+        0x0404: "Echo-suppressing Speakerphone",
+        0x0405: "Echo-canceling Speakerphone",
+        0x0501: "Phone Line",
+        0x0502: "Telephone",
+        0x0503: "Down Line Phone",
+        0x0601: "Analog Connector",
+        0x0602: "Digital Audio Interface",
+        0x0603: "Line Connector",
+        0x0605: "S/PDIF Interface",
+        0x0606: "IEEE 1394 DA Stream",
+        0x0607: "IEEE 1394 DV Stream Soundtrack"
+    }
+    return terminal_types.get(terminal_type, "Unknown")
+
+def get_audio_format_tag_name(format_tag):
+    format_tags = {
+        0x0000: "Type I Undefined",
+        0x0001: "PCM",
+        0x0002: "PCM8",
+        0x0003: "IEEE Float",
+        0x0004: "A-Law",
+        0x0005: "mu-Law",
+        0x1000: "Type II Undefined",
+        0x1001: "MPEG",
+        0x1002: "AC-3",
+        0x2000: "Type III Undefined",
+        0x2001: "IEC1937 AC-3",
+        0x2002: "IEC1937 MPEG-1 Layer 1",
+        0x2003: "IEC1937 MPEG-1 Layer 2/3"
+    }
+    return format_tags.get(format_tag, "Unknown")
+
+def get_language_name(langid):
+    # Common USB LANGIDs; see the USB-IF Language Identifiers document for the full list
+    languages = {
+        0x0401: "Arabic (Saudi Arabia)",
+        0x0404: "Chinese (Taiwan)",
+        0x0405: "Czech",
+        0x0406: "Danish",
+        0x0407: "German (Standard)",
+        0x0408: "Greek",
+        0x0409: "English (United States)",
+        0x040A: "Spanish (Traditional Sort)",
+        0x040B: "Finnish",
+        0x040C: "French (Standard)",
+        0x040D: "Hebrew",
+        0x040E: "Hungarian",
+        0x0410: "Italian (Standard)",
+        0x0411: "Japanese",
+        0x0412: "Korean",
+        0x0413: "Dutch (Netherlands)",
+        0x0414: "Norwegian (Bokmal)",
+        0x0415: "Polish",
+        0x0416: "Portuguese (Brazil)",
+        0x0419: "Russian",
+        0x041D: "Swedish",
+        0x041E: "Thai",
+        0x041F: "Turkish",
+        0x0421: "Indonesian",
+        0x0422: "Ukrainian",
+        0x042A: "Vietnamese",
+        0x0804: "Chinese (PRC)",
+        0x0807: "German (Switzerland)",
+        0x0809: "English (United Kingdom)",
+        0x080A: "Spanish (Mexican)",
+        0x080C: "French (Belgian)",
+        0x0816: "Portuguese (Standard)",
+        0x0C04: "Chinese (Hong Kong SAR, PRC)",
+        0x0C09: "English (Australian)",
+        0x0C0A: "Spanish (Modern Sort)",
+        0x0C0C: "French (Canadian)",
+        0x1009: "English (Canadian)",
+        0x04FF: "HID (Usage Data Descriptor)",
+        0xF0FF: "HID (Vendor Defined 1)",
+        0xF4FF: "HID (Vendor Defined 2)",
+        0xF8FF: "HID (Vendor Defined 3)",
+        0xFCFF: "HID (Vendor Defined 4)"
+    }
+    return languages.get(langid, "Unknown")
+
+def describe_string_index(index, strings=None):
+    """Describe a string descriptor index field, including its text when known"""
+    if strings is not None and index:
+        text = strings(index)
+        if text is not None:
+            return f"String descriptor index: \"{text}\""
+    return "String descriptor index"
+
+def _format_strings_terse(strings, fields):
+    if strings is None:
+        return ""
+    parts = []
+    for name, index in fields:
+        text = strings(index) if index else None
+        if text is not None:
+            parts.append(f" {name}={json.dumps(text)}")
+    return "".join(parts)
+
 def get_vendor_name(vendor_id):
     # This is a small subset of common USB vendors
     # In a real implementation, you would load this from a file
@@ -541,37 +1145,662 @@ def get_product_name(vendor_id, product_id):
     }
     return products.get((vendor_id, product_id), None)
 
-def parse_descriptor(data):
+# Labels used for parse_descriptor metrics, by descriptor type
+DESCRIPTOR_METRIC_LABELS = {
+    DEVICE_DESCRIPTOR: "device",
+    CONFIG_DESCRIPTOR: "configuration",
+    STRING_DESCRIPTOR: "string",
+    INTERFACE_DESCRIPTOR: "interface",
+    ENDPOINT_DESCRIPTOR: "endpoint",
+    HID_DESCRIPTOR: "hid",
+    IAD_DESCRIPTOR: "interface_association",
+    BOS_DESCRIPTOR: "bos",
+    CS_INTERFACE_DESCRIPTOR: "cs_interface",
+    CS_ENDPOINT_DESCRIPTOR: "cs_endpoint",
+}
+
+# Upper bounds (seconds) of the parse_descriptor latency histogram buckets
+METRICS_LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1)
+METRICS_WRITE_INTERVAL = 15.0
+
+def _new_metrics_snapshot():
+    return {
+        "decoded": {},
+        "unknown": {},
+        "errors": {},
+        "bytes": 0,
+        "buckets": [0] * (len(METRICS_LATENCY_BUCKETS) + 1),
+        "latency_sum": 0.0,
+        "latency_count": 0,
+    }
+
+def _add_metrics_snapshot(total, snapshot):
+    for name in ("decoded", "unknown", "errors"):
+        counts = total[name]
+        # copy() runs without releasing the GIL, so it is safe against concurrent updates
+        for label, count in snapshot[name].copy().items():
+            counts[label] = counts.get(label, 0) + count
+    total["bytes"] += snapshot["bytes"]
+    total["buckets"] = [a + b for a, b in zip(total["buckets"], list(snapshot["buckets"]))]
+    total["latency_sum"] += snapshot["latency_sum"]
+    total["latency_count"] += snapshot["latency_count"]
+
+def _escape_metric_label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+class MetricsRegistry:
     """
-    Parse a USB descriptor based on its type
+    Counters for long-running decode jobs, exported in Prometheus text format.
+    Each thread updates its own shard without taking a lock; the shards are
+    only summed when the metrics are written or scraped.
     """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._merged = []
+        self._lock = threading.Lock()  # Only taken to register a shard or to collect them
+        self.start_time = time.time()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _new_metrics_snapshot()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def observe(self, data_length, seconds, descriptor_type=None, unknown=False, error=None):
+        """Record one parse_descriptor call"""
+        shard = self._shard()
+        if error is not None:
+            # Keep only the fixed part of the message so the label set stays small
+            reason = error.split(":", 1)[0]
+            shard["errors"][reason] = shard["errors"].get(reason, 0) + 1
+        elif unknown:
+            label = f"0x{descriptor_type:02X}"
+            shard["unknown"][label] = shard["unknown"].get(label, 0) + 1
+        else:
+            label = DESCRIPTOR_METRIC_LABELS.get(descriptor_type, f"0x{descriptor_type:02X}")
+            shard["decoded"][label] = shard["decoded"].get(label, 0) + 1
+        shard["bytes"] += data_length
+        shard["buckets"][bisect.bisect_left(METRICS_LATENCY_BUCKETS, seconds)] += 1
+        shard["latency_sum"] += seconds
+        shard["latency_count"] += 1
+
+    def observe_input_error(self, reason):
+        """Record input rejected before reaching parse_descriptor, e.g. invalid hex"""
+        shard = self._shard()
+        shard["errors"][reason] = shard["errors"].get(reason, 0) + 1
+
+    def merge(self, snapshot):
+        """Add counters collected elsewhere, e.g. returned by a worker process"""
+        with self._lock:
+            self._merged.append(snapshot)
+
+    def snapshot(self):
+        """All counters summed into one plain (picklable) dict"""
+        total = _new_metrics_snapshot()
+        with self._lock:
+            shards = self._shards + self._merged
+        for shard in shards:
+            _add_metrics_snapshot(total, shard)
+        return total
+
+    def render(self):
+        """The current counters in Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+
+        def counter(name, help_text, label_name, counts):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for label in sorted(counts):
+                lines.append(f'{name}{{{label_name}="{_escape_metric_label(label)}"}} {counts[label]}')
+
+        counter("usb_decoder_descriptors_decoded_total", "Descriptors decoded by parse_descriptor, by type.",
+                "type", snapshot["decoded"])
+        counter("usb_decoder_unknown_descriptors_total", "Descriptors with an unknown bDescriptorType.",
+                "type", snapshot["unknown"])
+        counter("usb_decoder_decode_errors_total", "Descriptors rejected with a ValueError, or input rejected before decoding (invalid_hex for hex listings, too_short, read_error), by reason.",
+                "reason", snapshot["errors"])
+
+        lines.append("# HELP usb_decoder_bytes_processed_total Descriptor bytes passed to parse_descriptor.")
+        lines.append("# TYPE usb_decoder_bytes_processed_total counter")
+        lines.append(f"usb_decoder_bytes_processed_total {snapshot['bytes']}")
+
+        lines.append("# HELP usb_decoder_decode_latency_seconds Time spent in parse_descriptor.")
+        lines.append("# TYPE usb_decoder_decode_latency_seconds histogram")
+        cumulative = 0
+        for bound, count in zip(METRICS_LATENCY_BUCKETS, snapshot["buckets"]):
+            cumulative += count
+            lines.append(f'usb_decoder_decode_latency_seconds_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'usb_decoder_decode_latency_seconds_bucket{{le="+Inf"}} {snapshot["latency_count"]}')
+        lines.append(f"usb_decoder_decode_latency_seconds_sum {snapshot['latency_sum']}")
+        lines.append(f"usb_decoder_decode_latency_seconds_count {snapshot['latency_count']}")
+
+        lines.append("# HELP usb_decoder_start_time_seconds Unix time the decode job started.")
+        lines.append("# TYPE usb_decoder_start_time_seconds gauge")
+        lines.append(f"usb_decoder_start_time_seconds {self.start_time}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write the metrics to a file atomically, e.g. for node_exporter's textfile collector"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def start_file_writer(self, path, interval=METRICS_WRITE_INTERVAL):
+        """Rewrite the metrics file every interval seconds; returns a function that stops it after a final write"""
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.write(path)
+
+        thread = threading.Thread(target=run, name="metrics-writer", daemon=True)
+        thread.start()
+
+        def close():
+            stop.set()
+            thread.join()
+            self.write(path)
+        return close
+
+    def serve(self, port, host="127.0.0.1"):
+        """Serve the metrics over HTTP for scraping; returns the running server"""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        return server
+
+# Registry that parse_descriptor reports to, if any (see enable_metrics)
+_metrics = None
+
+def enable_metrics(registry):
+    """Make parse_descriptor report to registry; pass None to turn metrics off"""
+    global _metrics
+    _metrics = registry
+
+UNKNOWN_DESCRIPTOR_MESSAGE = "Unknown descriptor type"
+
+def record_input_error(reason):
+    """Count input that never reached parse_descriptor, if metrics are enabled"""
+    if _metrics is not None:
+        _metrics.observe_input_error(reason)
+
+def parse_descriptor(data, verbosity=VERBOSITY_EXPLAIN, strings=None):
+    """
+    Parse a USB descriptor based on its type, at one of the VERBOSITY_LEVELS.
+    strings optionally maps string indexes to text (see StringTable.resolver).
+    """
+    return _observe_parse(_parse_descriptor, data, verbosity, strings)
+
+def _observe_parse(parse, data, *args):
+    """Run a descriptor parser, recording the call in the metrics registry if enabled"""
+    if _metrics is None:
+        return parse(data, *args)
+
+    start = time.perf_counter()
+    try:
+        result = parse(data, *args)
+    except ValueError as e:
+        _metrics.observe(len(data), time.perf_counter() - start, error=str(e))
+        raise
+    _metrics.observe(len(data), time.perf_counter() - start, data[1], result.startswith(UNKNOWN_DESCRIPTOR_MESSAGE))
+    return result
+
+def _parse_descriptor(data, verbosity, strings):
     if len(data) < 2:
         raise ValueError("Invalid descriptor data, too short")
     
     descriptor_type = data[1]
     
     if descriptor_type == DEVICE_DESCRIPTOR:
-        return parse_device_descriptor(data)
+        return parse_device_descriptor(data, verbosity, strings)
     elif descriptor_type == CONFIG_DESCRIPTOR:
-        return parse_configuration_descriptor(data)
+        return parse_configuration_descriptor(data, verbosity)
     elif descriptor_type == STRING_DESCRIPTOR:
-        return parse_string_descriptor(data)
+        return parse_string_descriptor(data, verbosity)
     elif descriptor_type == INTERFACE_DESCRIPTOR:
-        return parse_interface_descriptor(data)
+        return parse_interface_descriptor(data, verbosity, strings)
     elif descriptor_type == ENDPOINT_DESCRIPTOR:
-        return parse_endpoint_descriptor(data)
+        return parse_endpoint_descriptor(data, verbosity)
     elif descriptor_type == HID_DESCRIPTOR and data[0] == 9:  # Check length to distinguish from DFU
-        return parse_hid_descriptor(data)
+        return parse_hid_descriptor(data, verbosity)
     elif descriptor_type == DFU_DESCRIPTOR and data[0] == 9:  # Check length to distinguish from HID
-        return parse_dfu_functional_descriptor(data)
+        return parse_dfu_functional_descriptor(data, verbosity)
     elif descriptor_type == IAD_DESCRIPTOR:
-        return parse_interface_association_descriptor(data)
+        return parse_interface_association_descriptor(data, verbosity)
     elif descriptor_type == BOS_DESCRIPTOR:
-        return parse_bos_descriptor(data)
+        return parse_bos_descriptor(data, verbosity)
     elif descriptor_type == 0x24:  # CDC Class-Specific descriptor
-        return parse_cdc_interface_descriptor(data)
+        return parse_cdc_interface_descriptor(data, verbosity)
     else:
-        return f"Unknown descriptor type: {descriptor_type:02X}"
+        return f"{UNKNOWN_DESCRIPTOR_MESSAGE}: {descriptor_type:02X}"
+
+def _byte_field(offset):
+    """Property reading one byte of the viewed descriptor"""
+    return property(lambda self: self._buf[self._offset + offset])
+
+def _word_field(offset):
+    """Property reading a little-endian 16-bit field of the viewed descriptor"""
+    def read(self):
+        base = self._offset + offset
+        return self._buf[base] | (self._buf[base + 1] << 8)
+    return property(read)
+
+class DescriptorView:
+    """
+    Lazy view of a descriptor at an offset inside a larger buffer. Fields are
+    decoded only when read, so filters can run over large captures without
+    formatting every descriptor.
+    """
+    __slots__ = ("_buf", "_offset")
+    name = "Descriptor"
+    min_length = 2
+    
+    def __init__(self, buffer, offset=0):
+        buf = memoryview(buffer)
+        if buf.format != 'B' or buf.ndim != 1:
+            buf = buf.cast('B')
+        if offset < 0 or len(buf) - offset < self.min_length:
+            raise ValueError(f"{self.name} requires at least {self.min_length} bytes")
+        self._buf = buf
+        self._offset = offset
+    
+    bLength = _byte_field(0)
+    bDescriptorType = _byte_field(1)
+    
+    @property
+    def offset(self):
+        return self._offset
+    
+    @property
+    def raw(self):
+        """The descriptor's bytes as a memoryview (no copy)"""
+        return self._buf[self._offset:self._offset + self.bLength]
+    
+    def tobytes(self):
+        return self.raw.tobytes()
+    
+    def __repr__(self):
+        return f"<{type(self).__name__} offset={self._offset} bLength={self.bLength}>"
+
+class DeviceView(DescriptorView):
+    __slots__ = ()
+    name = "Device Descriptor"
+    min_length = 18
+    
+    bcdUSB = _word_field(2)
+    bDeviceClass = _byte_field(4)
+    bDeviceSubClass = _byte_field(5)
+    bDeviceProtocol = _byte_field(6)
+    bMaxPacketSize0 = _byte_field(7)
+    idVendor = _word_field(8)
+    idProduct = _word_field(10)
+    bcdDevice = _word_field(12)
+    iManufacturer = _byte_field(14)
+    iProduct = _byte_field(15)
+    iSerialNumber = _byte_field(16)
+    bNumConfigurations = _byte_field(17)
+    
+    @property
+    def class_name(self):
+        return get_device_class_name(self.bDeviceClass)
+    
+    @property
+    def vendor_name(self):
+        return get_vendor_name(self.idVendor)
+    
+    @property
+    def product_name(self):
+        return get_product_name(self.idVendor, self.idProduct)
+
+class ConfigView(DescriptorView):
+    __slots__ = ()
+    name = "Configuration Descriptor"
+    min_length = 9
+    
+    wTotalLength = _word_field(2)
+    bNumInterfaces = _byte_field(4)
+    bConfigurationValue = _byte_field(5)
+    iConfiguration = _byte_field(6)
+    bmAttributes = _byte_field(7)
+    bMaxPower = _byte_field(8)
+    
+    @property
+    def self_powered(self):
+        return bool(self.bmAttributes & 0x80)
+    
+    @property
+    def remote_wakeup(self):
+        return bool(self.bmAttributes & 0x40)
+    
+    @property
+    def max_power_ma(self):
+        return self.bMaxPower * 2
+
+class InterfaceView(DescriptorView):
+    __slots__ = ()
+    name = "Interface Descriptor"
+    min_length = 9
+    
+    bInterfaceNumber = _byte_field(2)
+    bAlternateSetting = _byte_field(3)
+    bNumEndpoints = _byte_field(4)
+    bInterfaceClass = _byte_field(5)
+    bInterfaceSubClass = _byte_field(6)
+    bInterfaceProtocol = _byte_field(7)
+    iInterface = _byte_field(8)
+    
+    @property
+    def class_name(self):
+        return get_interface_class_name(self.bInterfaceClass)
+    
+    @property
+    def subclass_name(self):
+        return get_interface_subclass_name(self.bInterfaceClass, self.bInterfaceSubClass)
+    
+    @property
+    def protocol_name(self):
+        return get_interface_protocol_name(self.bInterfaceClass, self.bInterfaceSubClass, self.bInterfaceProtocol)
+
+class EndpointView(DescriptorView):
+    __slots__ = ()
+    name = "Endpoint Descriptor"
+    min_length = 7
+    
+    bEndpointAddress = _byte_field(2)
+    bmAttributes = _byte_field(3)
+    wMaxPacketSize = _word_field(4)
+    bInterval = _byte_field(6)
+    
+    @property
+    def endpoint_number(self):
+        return self.bEndpointAddress & 0x0F
+    
+    @property
+    def direction(self):
+        return "IN" if self.bEndpointAddress & 0x80 else "OUT"
+    
+    @property
+    def transfer_type(self):
+        return self.bmAttributes & 0x03
+    
+    @property
+    def transfer_type_name(self):
+        return get_transfer_type_name(self.transfer_type)
+
+class StringView(DescriptorView):
+    __slots__ = ()
+    name = "String Descriptor"
+    
+    @property
+    def text(self):
+        try:
+            return self._buf[self._offset + 2:self._offset + self.bLength].tobytes().decode('utf-16-le')
+        except Exception:
+            return "<decode error>"
+
+# View class used for each standard descriptor type
+DESCRIPTOR_VIEWS = {
+    DEVICE_DESCRIPTOR: DeviceView,
+    CONFIG_DESCRIPTOR: ConfigView,
+    STRING_DESCRIPTOR: StringView,
+    INTERFACE_DESCRIPTOR: InterfaceView,
+    ENDPOINT_DESCRIPTOR: EndpointView,
+}
+
+def iter_descriptor_views(buffer):
+    """
+    Walk a buffer of back-to-back descriptors (e.g. a full configuration),
+    yielding a view for each one. Types without a dedicated view get a plain
+    DescriptorView. Stops at a trailing fragment too short to hold a header.
+    """
+    buf = memoryview(buffer)
+    if buf.format != 'B' or buf.ndim != 1:
+        buf = buf.cast('B')
+    offset = 0
+    end = len(buf)
+    while end - offset >= 2:
+        length = buf[offset]
+        if length < 2:
+            raise ValueError(f"Invalid descriptor length {length} at offset {offset}")
+        if offset + length > end:
+            raise ValueError(f"Truncated descriptor at offset {offset}: bLength is {length} but only {end - offset} bytes remain")
+        view_class = DESCRIPTOR_VIEWS.get(buf[offset + 1], DescriptorView)
+        yield view_class(buf, offset)
+        offset += length
+
+# Decoded UVC/UAC stream tables and per-alt-setting bandwidth
+VideoFrame = namedtuple("VideoFrame", [
+    "frame_index", "width", "height", "max_bit_rate", "default_interval", "intervals", "continuous"
+])
+VideoFormat = namedtuple("VideoFormat", [
+    "interface", "format_index", "kind", "name", "bits_per_pixel", "frames"
+])
+AudioFormat = namedtuple("AudioFormat", [
+    "interface", "alternate", "uac_version", "format_tag", "formats", "channels", "subslot_size", "bit_resolution",
+    "sample_rates"
+])
+AltSettingBandwidth = namedtuple("AltSettingBandwidth", [
+    "interface", "alternate", "interface_class", "interface_subclass", "endpoint_address", "transfer_type",
+    "packet_size", "packets_per_interval", "intervals_per_second", "bytes_per_second"
+])
+StreamingTables = namedtuple("StreamingTables", ["video_formats", "audio_formats", "alt_settings"])
+
+# Service intervals per second for high speed (microframes) and full speed (frames)
+USB_SPEED_INTERVALS = {"full": 1000, "high": 8000, "super": 8000}
+STREAMING_TABLE_CACHE_SIZE = 1024
+
+class _InterfaceContext:
+    """Class information of the interface the descriptors being walked belong to"""
+    __slots__ = ("number", "alternate", "interface_class", "subclass", "protocol")
+    
+    def __init__(self, view=None):
+        self.number = view.bInterfaceNumber if view is not None else None
+        self.alternate = view.bAlternateSetting if view is not None else None
+        self.interface_class = view.bInterfaceClass if view is not None else None
+        self.subclass = view.bInterfaceSubClass if view is not None else None
+        self.protocol = view.bInterfaceProtocol if view is not None else None
+    
+    @property
+    def is_uvc(self):
+        """True for UVC VideoControl and VideoStreaming interfaces"""
+        return self.interface_class == 0x0E and self.subclass in (0x01, 0x02)
+    
+    @property
+    def uac_version(self):
+        """1 or 2 for UAC AudioControl and AudioStreaming interfaces, else None (MIDIStreaming, UAC 3)"""
+        if self.interface_class != 0x01 or self.subclass not in (0x01, 0x02):
+            return None
+        return {0x00: 1, 0x20: 2}.get(self.protocol)
+
+def parse_descriptor_set(data, verbosity=VERBOSITY_EXPLAIN, strings=None):
+    """
+    Decode a buffer of back-to-back descriptors such as a full configuration.
+    Class-specific (CS_INTERFACE/CS_ENDPOINT) descriptors are decoded for the
+    class of the interface they follow: UVC, UAC 1/2, or through
+    parse_descriptor otherwise. Every descriptor is counted in the metrics.
+    """
+    output = []
+    interface = _InterfaceContext()
+    try:
+        for view in iter_descriptor_views(data):
+            descriptor = view.tobytes()
+            descriptor_type = descriptor[1]
+            if descriptor_type == INTERFACE_DESCRIPTOR:
+                interface = _InterfaceContext(view)
+            
+            class_specific = descriptor_type in (CS_INTERFACE_DESCRIPTOR, CS_ENDPOINT_DESCRIPTOR)
+            if class_specific and interface.is_uvc:
+                output.append(_observe_parse(parse_uvc_descriptor, descriptor, verbosity, interface.subclass, strings))
+            elif class_specific and interface.uac_version is not None:
+                output.append(_observe_parse(parse_uac_descriptor, descriptor, verbosity, interface.subclass,
+                                             interface.uac_version, strings))
+            elif descriptor_type == DFU_DESCRIPTOR and interface.interface_class == 0xFE and interface.subclass == 0x01:
+                output.append(_observe_parse(parse_dfu_functional_descriptor, descriptor, verbosity))
+            else:
+                output.append(parse_descriptor(descriptor, verbosity, strings))
+    except ValueError as e:
+        output.append(f"Error: {str(e)}")
+    return "\n".join(output)
+
+def _video_frame(data):
+    values = {}
+    intervals = []
+    for name, _, _, _, value in _iter_class_fields(data, UVC_VS_LAYOUTS[data[2]][1]):
+        if name.startswith("dwFrameInterval[") or name in CONTINUOUS_RANGE_FIELDS["intervals"]:
+            intervals.append(value)
+        else:
+            values[name] = value
+    return VideoFrame(values.get("bFrameIndex", 0), values.get("wWidth", 0), values.get("wHeight", 0),
+                      values.get("dwMaxBitRate", 0), values.get("dwDefaultFrameInterval", 0),
+                      tuple(intervals), values.get("bFrameIntervalType", 0) == 0)
+
+def _endpoint_bandwidth(endpoint, companion, speed):
+    """(packet size, packets per interval, intervals per second) for an isochronous or interrupt endpoint"""
+    if companion is not None and len(companion) >= 6:
+        # SuperSpeed endpoints state their bytes per service interval directly
+        packet_size = companion[4] | (companion[5] << 8)
+        packets = 1
+        base = USB_SPEED_INTERVALS["super"]
+    else:
+        packet_size = endpoint.wMaxPacketSize & 0x07FF
+        base = USB_SPEED_INTERVALS.get(speed, USB_SPEED_INTERVALS["high"])
+        # Additional transactions per microframe only exist at high speed
+        packets = ((endpoint.wMaxPacketSize >> 11) & 0x03) + 1 if base != USB_SPEED_INTERVALS["full"] else 1
+    
+    interval = endpoint.bInterval
+    if endpoint.transfer_type == 1 or base != USB_SPEED_INTERVALS["full"]:
+        # Isochronous, and all high/super speed periodic endpoints, use 2^(bInterval-1)
+        intervals_per_second = base / (1 << (max(1, min(interval, 16)) - 1))
+    else:
+        # Full speed interrupt endpoints give bInterval in frames directly
+        intervals_per_second = base / max(1, interval)
+    return packet_size, packets, intervals_per_second
+
+@functools.lru_cache(maxsize=STREAMING_TABLE_CACHE_SIZE)
+def get_streaming_tables(descriptor_set, speed="high"):
+    """
+    Decode the UVC format/frame tables, UAC stream formats and the periodic
+    bandwidth of each alternate setting from a configuration descriptor set.
+    descriptor_set must be bytes. Results are memoized per unique (descriptor
+    set, speed), since every unit of a camera model reports the same set.
+    """
+    video_formats = []
+    audio_formats = []
+    alt_settings = []
+    interface = _InterfaceContext()
+    current_format = None
+    audio = None
+    views = list(iter_descriptor_views(descriptor_set))
+    
+    for position, view in enumerate(views):
+        descriptor_type = view.bDescriptorType
+        if descriptor_type == INTERFACE_DESCRIPTOR:
+            interface = _InterfaceContext(view)
+            current_format = None
+            audio = None
+            continue
+        
+        if descriptor_type == CS_INTERFACE_DESCRIPTOR and view.bLength >= 3:
+            data = view.tobytes()
+            subtype = data[2]
+            if interface.is_uvc and interface.subclass == 0x02:
+                if subtype in (0x04, 0x06, 0x10):
+                    values = {name: value for name, _, _, _, value in _iter_class_fields(data, UVC_VS_LAYOUTS[subtype][1])}
+                    if subtype == 0x06:
+                        kind, name, bits = "Compressed", "MJPEG", 0
+                    else:
+                        kind = "Uncompressed" if subtype == 0x04 else "Frame-based"
+                        name = (_guid_fourcc(data[5:21]) if len(data) >= 21 else None) or "Unknown"
+                        bits = values.get("bBitsPerPixel", 0)
+                    current_format = [interface.number, values.get("bFormatIndex", 0), kind, name, bits, []]
+                    video_formats.append(current_format)
+                elif subtype in (0x05, 0x07, 0x11) and current_format is not None:
+                    current_format[5].append(_video_frame(data))
+            elif interface.uac_version is not None and interface.subclass == 0x02:
+                if audio is None:
+                    audio = [interface.number, interface.alternate, interface.uac_version, None, None, 0, 0, 0, ()]
+                    audio_formats.append(audio)
+                layouts = UAC2_AS_LAYOUTS if interface.uac_version == 2 else UAC1_AS_LAYOUTS
+                if subtype in layouts:
+                    fields = list(_iter_class_fields(data, layouts[subtype][1]))
+                    values = {name: value for name, _, _, _, value in fields}
+                    if subtype == 0x01:
+                        # UAC 1 names one format tag, UAC 2 a bitmap of supported formats
+                        audio[3] = values.get("wFormatTag")
+                        audio[4] = values.get("bmFormats")
+                        audio[5] = values.get("bNrChannels", audio[5])
+                    else:
+                        audio[5] = values.get("bNrChannels", audio[5])
+                        audio[6] = values.get("bSubframeSize", values.get("bSubslotSize", 0))
+                        audio[7] = values.get("bBitResolution", 0)
+                        audio[8] = tuple(value for name, _, _, _, value in fields
+                                         if name.startswith("tSamFreq[") or name in CONTINUOUS_RANGE_FIELDS["sample_rates"])
+            continue
+        
+        if descriptor_type == ENDPOINT_DESCRIPTOR and view.transfer_type in (1, 3) and interface.number is not None:
+            companion = None
+            if position + 1 < len(views) and views[position + 1].bDescriptorType == SS_ENDPOINT_COMPANION_DESCRIPTOR:
+                companion = views[position + 1].tobytes()
+            packet_size, packets, per_second = _endpoint_bandwidth(view, companion, speed)
+            alt_settings.append(AltSettingBandwidth(
+                interface.number, interface.alternate, interface.interface_class, interface.subclass,
+                view.bEndpointAddress, view.transfer_type_name, packet_size, packets, per_second,
+                int(packet_size * packets * per_second)))
+    
+    return StreamingTables(
+        tuple(VideoFormat(*fmt[:5], tuple(fmt[5])) for fmt in video_formats),
+        tuple(AudioFormat(*fmt) for fmt in audio_formats),
+        tuple(alt_settings),
+    )
+
+def format_streaming_tables(tables):
+    """Human-readable summary of a StreamingTables result"""
+    output = []
+    for fmt in tables.video_formats:
+        bits = f", {fmt.bits_per_pixel} bpp" if fmt.bits_per_pixel else ""
+        output.append(f"Video interface {fmt.interface} format {fmt.format_index}: {fmt.kind} {fmt.name}{bits}")
+        for frame in fmt.frames:
+            if frame.continuous and len(frame.intervals) >= 2 and frame.intervals[0] and frame.intervals[1]:
+                rates = f"{10000000 / frame.intervals[1]:.2f}-{10000000 / frame.intervals[0]:.2f} fps (continuous)"
+            else:
+                rates = ", ".join(f"{10000000 / interval:.2f}" for interval in frame.intervals if interval) + " fps"
+            output.append(f"  frame {frame.frame_index}: {frame.width}x{frame.height} @ {rates}, "
+                          f"max {frame.max_bit_rate / 1000000:.2f} Mbit/s")
+    for fmt in tables.audio_formats:
+        if fmt.format_tag is not None:
+            tag = f"format 0x{fmt.format_tag:04X} ({get_audio_format_tag_name(fmt.format_tag)})"
+        elif fmt.formats is not None:
+            tag = f"bmFormats 0x{fmt.formats:08X}"
+        else:
+            tag = "unknown format"
+        rates = ", ".join(f"{rate} Hz" for rate in fmt.sample_rates) if fmt.sample_rates else "rates set by clock source"
+        output.append(f"Audio interface {fmt.interface} alt {fmt.alternate} (UAC{fmt.uac_version}): {tag}, "
+                      f"{fmt.channels} channels, {fmt.subslot_size} byte subslots, {fmt.bit_resolution} bits, {rates}")
+    for alt in tables.alt_settings:
+        output.append(f"Interface {alt.interface} alt {alt.alternate} EP 0x{alt.endpoint_address:02X} ({alt.transfer_type}): "
+                      f"{alt.packets_per_interval} x {alt.packet_size} bytes, {alt.intervals_per_second:g} intervals/s = "
+                      f"{alt.bytes_per_second} bytes/s ({alt.bytes_per_second * 8 / 1000000:.2f} Mbit/s)")
+    return "\n".join(output)
 
 def bytes_to_display_string(data):
     """Convert a bytes object to a displayable hex string"""
@@ -596,264 +1825,1184 @@ def parse_hex_string(hex_string):
     except ValueError as e:
         raise ValueError(f"Invalid hex string: {e}")
 
-class USBDecoderApp(QMainWindow):
+# Number of capture files handed to a worker process at a time in directory mode
+CAPTURE_SHARD_SIZE = 256
+
+def available_cpu_count():
+    """Number of CPUs this process may run on, honouring affinity masks where the OS has them"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def load_descriptor_file(file_name):
+    """Read descriptor bytes from a binary file or a .txt file containing ASCII hex"""
+    with open(file_name, 'rb') as f:
+        data = f.read()
+    
+    # If it's a text file, try to parse it as hex
+    if file_name.lower().endswith('.txt'):
+        try:
+            data = parse_hex_string(data.decode())
+        except (UnicodeDecodeError, ValueError):
+            # If parsing as hex fails, use the binary data anyway. It is still
+            # decoded, so it is not counted as rejected input
+            pass
+    
+    return data
+
+def decode_descriptor_bytes(data, verbosity=VERBOSITY_EXPLAIN):
+    """Decode descriptor bytes into the text shown by the GUI and batch modes, errors included"""
+    if len(data) < 2:
+        record_input_error("too_short")
+        return "Descriptor data is too short."
+    try:
+        if len(data) > data[0]:
+            # Several descriptors, e.g. a full configuration: class-specific ones
+            # can only be decoded knowing the interface they follow
+            return parse_descriptor_set(data, verbosity)
+        return parse_descriptor(data, verbosity)
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+def decode_capture_file(file_name, verbosity=VERBOSITY_EXPLAIN):
+    """Decode a single capture file, returning the text written for it in batch output"""
+    try:
+        data = load_descriptor_file(file_name)
+    except OSError as e:
+        record_input_error("read_error")
+        return f"Error: {str(e)}"
+    return decode_descriptor_bytes(data, verbosity)
+
+def list_capture_files(directory, exclude=()):
+    """Return the files under a directory as sorted relative paths, skipping excluded paths"""
+    excluded = {os.path.abspath(path) for path in exclude}
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = [d for d in dirs if os.path.abspath(os.path.join(root, d)) not in excluded]
+        for name in names:
+            path = os.path.join(root, name)
+            if os.path.abspath(path) not in excluded:
+                files.append(os.path.relpath(path, directory))
+    files.sort()
+    return files
+
+def _decode_capture_shard(directory, shard_path, file_names, verbosity, collect_metrics=False):
+    """
+    Decode one shard of capture files into a JSON-lines part file (runs in a
+    worker process). Returns the file names and, if collect_metrics is set,
+    a snapshot of the shard's decode metrics.
+    """
+    registry = None
+    if collect_metrics:
+        registry = MetricsRegistry()
+        enable_metrics(registry)
+    tmp_path = shard_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for name in file_names:
+            output = decode_capture_file(os.path.join(directory, name), verbosity)
+            f.write(json.dumps({"file": name, "output": output}) + "\n")
+    
+    # Only publish the part file once it is complete
+    os.replace(tmp_path, shard_path)
+    if registry is not None:
+        enable_metrics(None)
+        return file_names, registry.snapshot()
+    return file_names, None
+
+def _load_checkpoint(checkpoint_path, directory, verbosity):
+    if not os.path.exists(checkpoint_path):
+        return {"directory": os.path.abspath(directory), "verbosity": verbosity, "next_shard": 0, "shards": {}}
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("directory") != os.path.abspath(directory):
+        raise ValueError(f"Checkpoint {checkpoint_path} belongs to a different directory: {manifest.get('directory')}")
+    if manifest.get("verbosity", VERBOSITY_EXPLAIN) != verbosity:
+        raise ValueError(f"Checkpoint {checkpoint_path} was written with verbosity '{manifest.get('verbosity', VERBOSITY_EXPLAIN)}'")
+    return manifest
+
+def _save_checkpoint(checkpoint_path, manifest):
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, checkpoint_path)
+
+def _merge_capture_shards(parts_dir, shard_names, output_path, verbosity):
+    # Each part file is sorted by file name, so a k-way merge gives a deterministic order
+    part_files = [open(os.path.join(parts_dir, name), 'r', encoding='utf-8') for name in sorted(shard_names)]
+    try:
+        records = heapq.merge(*[map(json.loads, f) for f in part_files], key=lambda record: record["file"])
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            for record in records:
+                if verbosity == VERBOSITY_TERSE:
+                    # Keep terse output to one line per file
+                    out.write(f"{record['file']}: {record['output']}\n")
+                else:
+                    out.write(f"=== {record['file']} ===\n{record['output']}\n\n")
+        os.replace(tmp_path, output_path)
+    finally:
+        for f in part_files:
+            f.close()
+
+def decode_capture_directory(directory, output_path, checkpoint_path=None, workers=None,
+                             shard_size=CAPTURE_SHARD_SIZE, verbosity=VERBOSITY_EXPLAIN, metrics=None):
+    """
+    Decode every file under a directory across worker processes and merge the
+    results into output_path. Finished shards are recorded in a checkpoint
+    manifest so an interrupted run resumes without redoing them.
+    Decode metrics from the workers are merged into metrics if one is given.
+    Returns the number of files in the merged output.
+    """
+    if not os.path.isdir(directory):
+        raise ValueError(f"Not a directory: {directory}")
+    if checkpoint_path is None:
+        checkpoint_path = output_path + ".checkpoint.json"
+    parts_dir = output_path + ".parts"
+    os.makedirs(parts_dir, exist_ok=True)
+    
+    manifest = _load_checkpoint(checkpoint_path, directory, verbosity)
+    shards = manifest["shards"]
+    
+    # Forget shards whose part file has gone missing so their files are decoded again
+    for shard_name in list(shards):
+        if not os.path.exists(os.path.join(parts_dir, shard_name)):
+            del shards[shard_name]
+    
+    # Drop part files from shards that finished (or died) without reaching the checkpoint
+    for part_name in os.listdir(parts_dir):
+        shard_name = part_name[:-len(".tmp")] if part_name.endswith(".tmp") else part_name
+        if part_name.startswith("shard-") and shard_name.endswith(".jsonl") and part_name not in shards:
+            os.remove(os.path.join(parts_dir, part_name))
+    
+    done = set()
+    for file_names in shards.values():
+        done.update(file_names)
+    
+    exclude = (output_path, output_path + ".tmp", checkpoint_path, checkpoint_path + ".tmp", parts_dir)
+    pending = [name for name in list_capture_files(directory, exclude) if name not in done]
+    
+    if pending:
+        workers = workers or available_cpu_count()
+        # Keep every worker busy even when only a few files are left
+        shard_size = max(1, min(shard_size, -(-len(pending) // workers)))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for start in range(0, len(pending), shard_size):
+                shard_name = f"shard-{manifest['next_shard']:06d}.jsonl"
+                manifest["next_shard"] += 1
+                shard_path = os.path.join(parts_dir, shard_name)
+                future = executor.submit(_decode_capture_shard, directory, shard_path,
+                                         pending[start:start + shard_size], verbosity, metrics is not None)
+                futures[future] = shard_name
+            
+            for future in as_completed(futures):
+                file_names, snapshot = future.result()
+                shards[futures[future]] = file_names
+                _save_checkpoint(checkpoint_path, manifest)
+                if snapshot is not None:
+                    metrics.merge(snapshot)
+    else:
+        _save_checkpoint(checkpoint_path, manifest)
+    
+    _merge_capture_shards(parts_dir, shards.keys(), output_path, verbosity)
+    return sum(len(file_names) for file_names in shards.values())
+
+# Control-transfer reassembly
+GET_DESCRIPTOR = 0x06
+HID_REPORT_DESCRIPTOR = 0x22
+CONTROL_TRANSFER_TIMEOUT = 5.0    # Seconds before an unfinished transfer is dropped
+MAX_CONTROL_TRANSFERS = 4096      # In-flight transfers kept before the oldest is evicted
+
+# Event kinds produced by the capture readers and consumed by the reassembler
+EVENT_SETUP = "setup"
+EVENT_DATA = "data"
+EVENT_STATUS = "status"
+EVENT_STALL = "stall"
+EVENT_ABORT = "abort"
+
+# A reassembled GET_DESCRIPTOR response. key is (bus, device address, endpoint).
+ControlTransfer = namedtuple("ControlTransfer", [
+    "key", "descriptor_type", "descriptor_index", "language_id", "requested_length", "data", "timestamp"
+])
+
+class _PendingTransfer:
+    __slots__ = ("descriptor_type", "descriptor_index", "language_id", "buffer", "view", "filled", "last_seen")
+    
+    def __init__(self, wValue, wIndex, wLength, timestamp):
+        self.descriptor_type = wValue >> 8
+        self.descriptor_index = wValue & 0xFF
+        self.language_id = wIndex
+        # Preallocate the whole data stage so packets are copied in place
+        self.buffer = bytearray(wLength)
+        self.view = memoryview(self.buffer)
+        self.filled = 0
+        self.last_seen = timestamp
+
+class ControlTransferReassembler:
+    """
+    Joins the DATA stage of GET_DESCRIPTOR control transfers back into one
+    buffer per transfer. Transfers are tracked per (bus, device, endpoint);
+    a transfer ends when wLength bytes have arrived, on a short packet (once
+    the device's bMaxPacketSize0 is known), or on its status stage. Memory is bounded by max_in_flight.
+    """
+    
+    def __init__(self, timeout=CONTROL_TRANSFER_TIMEOUT, max_in_flight=MAX_CONTROL_TRANSFERS):
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self._pending = OrderedDict()
+        self._max_packet = OrderedDict()
+        self.stalled = 0
+        self.aborted = 0
+        self.timed_out = 0
+        self.evicted = 0
+    
+    def __len__(self):
+        return len(self._pending)
+    
+    def setup(self, key, setup_packet, timestamp=0.0):
+        if len(setup_packet) < 8:
+            raise ValueError("SETUP packet requires 8 bytes")
+        bmRequestType, bRequest, wValue, wIndex, wLength = struct.unpack_from("<BBHHH", setup_packet)
+        
+        # A new SETUP always aborts whatever was in flight on the endpoint
+        self._pending.pop(key, None)
+        if bRequest != GET_DESCRIPTOR or not bmRequestType & 0x80 or wLength == 0:
+            return
+        
+        self._pending[key] = _PendingTransfer(wValue, wIndex, wLength, timestamp)
+        if len(self._pending) > self.max_in_flight:
+            self._pending.popitem(last=False)
+            self.evicted += 1
+    
+    def data(self, key, payload, timestamp=0.0):
+        """Add a DATA stage packet; returns the ControlTransfer if this packet completed it"""
+        pending = self._pending.get(key)
+        if pending is None:
+            return None
+        
+        count = min(len(payload), len(pending.buffer) - pending.filled)
+        pending.view[pending.filled:pending.filled + count] = payload[:count]
+        pending.filled += count
+        pending.last_seen = timestamp
+        self._pending.move_to_end(key)
+        
+        # A short packet only ends the transfer once the endpoint's packet size is
+        # known; until then the status stage does
+        max_packet = self._max_packet.get(key)
+        if pending.filled == len(pending.buffer) or (max_packet and len(payload) < max_packet):
+            return self._complete(key, timestamp)
+        return None
+    
+    def status(self, key, timestamp=0.0):
+        """Status stage seen; returns the ControlTransfer if one was still in flight"""
+        if key not in self._pending:
+            return None
+        return self._complete(key, timestamp)
+    
+    def stall(self, key):
+        if self._pending.pop(key, None) is not None:
+            self.stalled += 1
+    
+    def abort(self, key):
+        if self._pending.pop(key, None) is not None:
+            self.aborted += 1
+    
+    def expire(self, now):
+        """Drop transfers that have seen no traffic for longer than the timeout"""
+        while self._pending:
+            key, pending = next(iter(self._pending.items()))
+            if now - pending.last_seen <= self.timeout:
+                break
+            del self._pending[key]
+            self.timed_out += 1
+    
+    def _complete(self, key, timestamp):
+        pending = self._pending.pop(key)
+        data = pending.view[:pending.filled].tobytes()
+        pending.view.release()
+        
+        # Learn the real control endpoint packet size from the device descriptor
+        if pending.descriptor_type == DEVICE_DESCRIPTOR and len(data) >= 8 and data[7]:
+            self._max_packet[key] = data[7]
+            self._max_packet.move_to_end(key)
+            if len(self._max_packet) > self.max_in_flight:
+                self._max_packet.popitem(last=False)
+        
+        return ControlTransfer(key, pending.descriptor_type, pending.descriptor_index, pending.language_id,
+                               len(pending.buffer), data, timestamp)
+
+def reassemble_control_transfers(events, reassembler=None):
+    """Feed (kind, key, payload, timestamp) events through a reassembler, yielding each ControlTransfer"""
+    if reassembler is None:
+        reassembler = ControlTransferReassembler()
+    last_expire = None
+    for kind, key, payload, timestamp in events:
+        if kind == EVENT_SETUP:
+            reassembler.setup(key, payload, timestamp)
+            transfer = None
+        elif kind == EVENT_DATA:
+            transfer = reassembler.data(key, payload, timestamp)
+        elif kind == EVENT_STATUS:
+            transfer = reassembler.status(key, timestamp)
+        elif kind == EVENT_STALL:
+            reassembler.stall(key)
+            transfer = None
+        else:
+            reassembler.abort(key)
+            transfer = None
+        
+        if transfer is not None:
+            yield transfer
+        
+        # Check for timed out transfers about once a second of capture time
+        if last_expire is None or timestamp - last_expire >= 1.0:
+            reassembler.expire(timestamp)
+            last_expire = timestamp
+
+def parse_usbmon_text_line(line):
+    """
+    Parse one line of usbmon text output (/sys/kernel/debug/usb/usbmon/Nu)
+    into a list of reassembler events. Only control transfers produce events.
+    """
+    words = line.split()
+    if len(words) < 5 or not words[3].startswith("C"):
+        return []
+    
+    # Address word is e.g. "Ci:1:002:0" (or "Ci:002:0" in the old format without a bus number)
+    address = words[3].split(":")
+    try:
+        if len(address) == 4:
+            key = (int(address[1]), int(address[2]), int(address[3]))
+        else:
+            key = (0, int(address[1]), int(address[2]))
+        timestamp = int(words[1]) / 1000000.0
+        
+        if words[2] == "S":
+            if words[4] != "s" or len(words) < 10:
+                return []
+            setup = struct.pack("<BBHHH", int(words[5], 16), int(words[6], 16),
+                                int(words[7], 16), int(words[8], 16), int(words[9], 16))
+            return [(EVENT_SETUP, key, setup, timestamp)]
+        
+        if words[2] == "E":
+            return [(EVENT_ABORT, key, None, timestamp)]
+        
+        if words[2] == "C":
+            status = int(words[4])
+            if status == -32:  # -EPIPE, the endpoint stalled
+                return [(EVENT_STALL, key, None, timestamp)]
+            if status != 0 and status != -121:  # -EREMOTEIO is just a short transfer
+                return [(EVENT_ABORT, key, None, timestamp)]
+            events = []
+            if len(words) > 6 and words[6] == "=":
+                events.append((EVENT_DATA, key, bytes.fromhex("".join(words[7:])), timestamp))
+            events.append((EVENT_STATUS, key, None, timestamp))
+            return events
+    except ValueError:
+        pass
+    return []
+
+# The kernel keeps only the low 12 bits of the seconds in usbmon text timestamps
+USBMON_TIMESTAMP_PERIOD = 4096.0
+
+def iter_usbmon_text_events(lines):
+    """
+    Yield reassembler events from an iterable of usbmon text lines, with
+    timestamps unwrapped so they keep increasing across the 4096 s rollover.
+    """
+    offset = 0.0
+    last = None
+    for line in lines:
+        for kind, key, payload, timestamp in parse_usbmon_text_line(line):
+            # Small steps back are reordering between CPUs; a large one is a wrap
+            if last is not None and timestamp + offset < last - USBMON_TIMESTAMP_PERIOD / 2:
+                offset += USBMON_TIMESTAMP_PERIOD
+            last = timestamp + offset
+            yield kind, key, payload, last
+
+# pcap link types understood by the capture reader
+LINKTYPE_USB_LINUX = 189
+LINKTYPE_USB_LINUX_MMAPPED = 220
+LINKTYPE_USB_2_0 = 288
+
+def iter_pcap_records(f):
+    """Yield (timestamp, linktype, packet bytes) from a classic pcap file object"""
+    header = f.read(24)
+    if len(header) < 24:
+        raise ValueError("File is too short to be a pcap capture")
+    magic = header[:4]
+    if magic == b"\xd4\xc3\xb2\xa1":
+        endian, scale = "<", 1e-6
+    elif magic == b"\xa1\xb2\xc3\xd4":
+        endian, scale = ">", 1e-6
+    elif magic == b"\x4d\x3c\xb2\xa1":
+        endian, scale = "<", 1e-9
+    elif magic == b"\xa1\xb2\x3c\x4d":
+        endian, scale = ">", 1e-9
+    elif magic == b"\x0a\x0d\x0d\x0a":
+        raise ValueError("pcapng captures are not supported, save the capture as pcap instead")
+    else:
+        raise ValueError("Not a pcap capture")
+    linktype = struct.unpack_from(endian + "I", header, 20)[0] & 0x0FFFFFFF
+    record_header = struct.Struct(endian + "IIII")
+    
+    while True:
+        chunk = f.read(16)
+        if len(chunk) < 16:
+            return
+        ts_sec, ts_frac, captured, _ = record_header.unpack(chunk)
+        packet = f.read(captured)
+        if len(packet) < captured:
+            return
+        yield ts_sec + ts_frac * scale, linktype, packet
+
+# struct usbmon_packet as written by libpcap for LINKTYPE_USB_LINUX(_MMAPPED)
+_USBMON_PACKET = struct.Struct("<QcBBBHccqiiII8s")
+
+def _usbmon_packet_events(packet, header_length, timestamp):
+    if len(packet) < header_length:
+        return []
+    (_, event_type, xfer_type, epnum, devnum, busnum, flag_setup, _,
+     _, _, status, _, data_length, setup) = _USBMON_PACKET.unpack_from(packet)
+    if xfer_type != 2:  # Control transfers only
+        return []
+    key = (busnum, devnum, epnum & 0x7F)
+    
+    if event_type == b"S":
+        if flag_setup == b"\x00":
+            return [(EVENT_SETUP, key, setup, timestamp)]
+        return []
+    if event_type == b"E":
+        return [(EVENT_ABORT, key, None, timestamp)]
+    if event_type == b"C":
+        if status == -32:
+            return [(EVENT_STALL, key, None, timestamp)]
+        if status != 0 and status != -121:
+            return [(EVENT_ABORT, key, None, timestamp)]
+        events = []
+        payload = packet[header_length:header_length + data_length]
+        if payload:
+            events.append((EVENT_DATA, key, payload, timestamp))
+        events.append((EVENT_STATUS, key, None, timestamp))
+        return events
+    return []
+
+# USB 2.0 packet identifiers
+PID_OUT = 0xE1
+PID_IN = 0x69
+PID_SETUP = 0x2D
+PID_DATA0 = 0xC3
+PID_DATA1 = 0x4B
+PID_ACK = 0xD2
+PID_STALL = 0x1E
+
+class _Usb2PacketTracker:
+    """Turns raw USB 2.0 packets (token, data, handshake) into reassembler events"""
+    
+    def __init__(self):
+        self._token = None       # (pid, key) of the most recent token
+        self._data = None        # (pid, payload) waiting for its handshake
+        self._toggles = {}       # Last accepted DATA PID per IN endpoint
+    
+    def packet_events(self, packet, timestamp):
+        if not packet:
+            return []
+        pid = packet[0]
+        
+        if pid in (PID_SETUP, PID_IN, PID_OUT) and len(packet) >= 3:
+            address = packet[1] & 0x7F
+            endpoint = ((packet[1] >> 7) | (packet[2] << 1)) & 0x0F
+            self._token = (pid, (0, address, endpoint))
+            self._data = None
+            return []
+        
+        if self._token is None:
+            return []
+        token_pid, key = self._token
+        
+        if pid in (PID_DATA0, PID_DATA1):
+            # Strip the CRC16 and hold the payload until the handshake confirms it
+            self._data = (pid, packet[1:-2])
+            return []
+        
+        events = []
+        if pid == PID_ACK and self._data is not None:
+            data_pid, payload = self._data
+            if token_pid == PID_SETUP:
+                self._toggles[key] = PID_DATA0
+                events.append((EVENT_SETUP, key, payload, timestamp))
+            elif token_pid == PID_IN:
+                # A repeated toggle means the host's ACK was lost and the device resent
+                if self._toggles.get(key) != data_pid:
+                    self._toggles[key] = data_pid
+                    events.append((EVENT_DATA, key, payload, timestamp))
+            elif token_pid == PID_OUT and not payload:
+                events.append((EVENT_STATUS, key, None, timestamp))
+        elif pid == PID_STALL:
+            events.append((EVENT_STALL, key, None, timestamp))
+        
+        self._token = None
+        self._data = None
+        return events
+
+def iter_pcap_control_events(f):
+    """Yield reassembler events from a pcap of usbmon URBs or raw USB 2.0 packets"""
+    tracker = _Usb2PacketTracker()
+    for timestamp, linktype, packet in iter_pcap_records(f):
+        if linktype == LINKTYPE_USB_LINUX:
+            yield from _usbmon_packet_events(packet, 48, timestamp)
+        elif linktype == LINKTYPE_USB_LINUX_MMAPPED:
+            yield from _usbmon_packet_events(packet, 64, timestamp)
+        elif linktype == LINKTYPE_USB_2_0:
+            yield from tracker.packet_events(packet, timestamp)
+        else:
+            raise ValueError(f"Unsupported pcap link type: {linktype}")
+
+def iter_capture_events(f):
+    """Yield reassembler events from a binary file object holding a pcap or usbmon text capture"""
+    head = f.read(4)
+    f.seek(0)
+    if head in (b"\xd4\xc3\xb2\xa1", b"\xa1\xb2\xc3\xd4", b"\x4d\x3c\xb2\xa1", b"\xa1\xb2\x3c\x4d", b"\x0a\x0d\x0d\x0a"):
+        yield from iter_pcap_control_events(f)
+    else:
+        yield from iter_usbmon_text_events(line.decode(errors="replace") for line in f)
+
+# Follow mode for growing usbmon text logs
+FOLLOW_POLL_INTERVAL = 0.2      # Seconds between checks once the end of the log is reached
+FOLLOW_READ_SIZE = 65536
+FOLLOW_MAX_LINE = 1 << 20       # Longer partial lines are discarded to keep memory constant
+
+def follow_lines(path, from_start=False, poll_interval=FOLLOW_POLL_INTERVAL, idle_timeout=None):
+    """
+    Yield lines as they are appended to a log file, like `tail -F`. The file
+    is reopened when it is rotated (replaced by a new file) and reread from
+    the start when it is truncated. Returns once nothing new has arrived for
+    idle_timeout seconds, or runs until interrupted if idle_timeout is None.
+    """
+    f = None
+    partial = bytearray()
+    last_data = time.monotonic()
+    try:
+        while True:
+            if f is None:
+                try:
+                    f = open(path, 'rb')
+                except FileNotFoundError:
+                    # Between rotation steps the log may briefly not exist; whatever
+                    # shows up next is all new
+                    from_start = True
+                else:
+                    if not from_start:
+                        f.seek(0, os.SEEK_END)
+                    # Anything after a reopen is new, so read rotated files from the start
+                    from_start = True
+            
+            chunk = f.read(FOLLOW_READ_SIZE) if f is not None else b""
+            if chunk:
+                last_data = time.monotonic()
+                partial += chunk
+                lines = partial.split(b"\n")
+                partial = bytearray(lines.pop())
+                if len(partial) > FOLLOW_MAX_LINE:
+                    partial.clear()
+                for line in lines:
+                    yield line.decode(errors="replace")
+                continue
+            
+            # At the end of the file: check whether it was rotated or truncated
+            if f is not None:
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    st = None
+                if st is None or st.st_ino != os.fstat(f.fileno()).st_ino:
+                    f.close()
+                    f = None
+                    partial.clear()
+                    continue
+                if st.st_size < f.tell():
+                    f.seek(0)
+                    partial.clear()
+                    continue
+            
+            if idle_timeout is not None and time.monotonic() - last_data >= idle_timeout:
+                return
+            time.sleep(poll_interval)
+    finally:
+        if f is not None:
+            f.close()
+
+def follow_usbmon_log(path, verbosity=VERBOSITY_EXPLAIN, from_start=False,
+                      poll_interval=FOLLOW_POLL_INTERVAL, idle_timeout=None):
+    """Decode GET_DESCRIPTOR responses from a usbmon text log as they are written"""
+    lines = follow_lines(path, from_start, poll_interval, idle_timeout)
+    for transfer in reassemble_control_transfers(iter_usbmon_text_events(lines)):
+        yield decode_control_transfer(transfer, verbosity)
+
+class StringTable:
+    """
+    String descriptors collected per (device, index, langid). Decoded text
+    is interned in one pool keyed by the raw descriptor bytes, so a name
+    repeated across many devices is decoded and stored only once.
+    
+    A device descriptor response starts a new enumeration of that bus
+    address, so a device that takes over a reused address does not inherit
+    its predecessor's strings. Call rewind() before replaying a capture
+    whose strings were collected in an earlier pass.
+    """
+    
     def __init__(self):
-        super().__init__()
-        
-        self.setWindowTitle("USB Descriptor Decoder")
-        self.setMinimumSize(1000, 600)
-        
-        # Create main widget and layout
-        self.main_widget = QWidget()
-        self.setCentralWidget(self.main_widget)
-        self.main_layout = QVBoxLayout(self.main_widget)
-        
-        # Create splitter for input/output
-        self.splitter = QSplitter(Qt.Orientation.Horizontal)
-        self.main_layout.addWidget(self.splitter)
-        
-        # Input panel
-        self.input_widget = QWidget()
-        self.input_layout = QVBoxLayout(self.input_widget)
-        
-        self.input_label = QLabel("Enter USB descriptor bytes as hex:")
-        self.input_layout.addWidget(self.input_label)
-        
-        self.input_text = QTextEdit()
-        self.input_text.setPlaceholderText("Example: 12 01 00 02 00 00 00 40 5E 04 3D 00 01 02 01 02 00 01")
-        self.input_layout.addWidget(self.input_text)
-        
-        # Descriptor type selector
-        self.descriptor_type_layout = QHBoxLayout()
-        self.descriptor_type_label = QLabel("Descriptor Type:")
-        self.descriptor_type_combo = QComboBox()
-        self.descriptor_type_combo.addItem("Auto-detect", -1)
-        self.descriptor_type_combo.addItem("Device", DEVICE_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("Configuration", CONFIG_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("String", STRING_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("Interface", INTERFACE_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("Endpoint", ENDPOINT_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("HID", HID_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("BOS", BOS_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("Interface Association", IAD_DESCRIPTOR)
-        self.descriptor_type_combo.addItem("DFU Functional", DFU_DESCRIPTOR)
-        
-        self.descriptor_type_layout.addWidget(self.descriptor_type_label)
-        self.descriptor_type_layout.addWidget(self.descriptor_type_combo)
-        self.input_layout.addLayout(self.descriptor_type_layout)
-        
-        self.decode_button = QPushButton("Decode")
-        self.decode_button.clicked.connect(self.decode_descriptor)
-        self.input_layout.addWidget(self.decode_button)
-        
-        self.load_file_button = QPushButton("Load from File")
-        self.load_file_button.clicked.connect(self.load_from_file)
-        self.input_layout.addWidget(self.load_file_button)
-        
-        # Output panel
-        self.output_widget = QWidget()
-        self.output_layout = QVBoxLayout(self.output_widget)
-        
-        self.output_label = QLabel("Decoded Descriptor:")
-        self.output_layout.addWidget(self.output_label)
-        
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_layout.addWidget(self.output_text)
-        
-        self.copy_button = QPushButton("Copy to Clipboard")
-        self.copy_button.clicked.connect(self.copy_to_clipboard)
-        self.output_layout.addWidget(self.copy_button)
-        
-        # Add widgets to splitter
-        self.splitter.addWidget(self.input_widget)
-        self.splitter.addWidget(self.output_widget)
-        self.splitter.setSizes([400, 600])
-        
-        # Status bar
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        
-        # Create toolbar
-        self.toolbar = QToolBar("Main Toolbar")
-        self.addToolBar(self.toolbar)
-        
-        # Add actions to toolbar
-        self.clear_action = QAction("Clear All", self)
-        self.clear_action.triggered.connect(self.clear_all)
-        self.toolbar.addAction(self.clear_action)
-        
-        self.about_action = QAction("About", self)
-        self.about_action.triggered.connect(self.show_about)
-        self.toolbar.addAction(self.about_action)
-        
-        # Set dark theme option
-        self.dark_theme_check = QCheckBox("Dark Theme")
-        self.dark_theme_check.stateChanged.connect(self.toggle_theme)
-        self.toolbar.addWidget(self.dark_theme_check)
-        
-        # Load settings
-        self.settings = QSettings("USBDecoder", "USBDecoderApp")
-        self.load_settings()
-        
-        # Show a welcome message
-        self.output_text.setPlainText("Welcome to the USB Descriptor Decoder!\n\n"
-                                     "Enter USB descriptor bytes in hex format, then click 'Decode'.\n\n"
-                                     "Examples:\n"
-                                     "- Device Descriptor: 12 01 00 02 00 00 00 40 5E 04 3D 00 01 02 01 02 00 01\n"
-                                     "- Config Descriptor: 09 02 20 00 01 01 00 80 32\n"
-                                     "- Interface Descriptor: 09 04 00 00 02 08 06 50 00\n\n"
-                                     "Tip: When analyzing USB devices with Packetry or Wireshark, copy the descriptor bytes here for detailed information.")
-        
-    def decode_descriptor(self):
+        self._pool = {}
+        self._strings = {}
+        self._langids = {}
+        self._generations = {}
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    @property
+    def pool_size(self):
+        """Number of distinct strings held"""
+        return len(self._pool)
+    
+    def intern(self, data):
+        """Return the pooled text for a string descriptor's bytes"""
+        raw = bytes(data[2:data[0]])
+        text = self._pool.get(raw)
+        if text is None:
+            try:
+                text = raw.decode('utf-16-le')
+            except Exception:
+                text = "<decode error>"
+            self._pool[raw] = text
+        return text
+    
+    def rewind(self):
+        """Restart enumeration tracking, to replay the capture the table was filled from"""
+        self._generations = {}
+    
+    def new_enumeration(self, device):
+        """Start a new enumeration of a bus address; later strings for it are kept apart"""
+        self._generations[device] = self._generations.get(device, 0) + 1
+    
+    def add_langids(self, device, data):
+        end = min(data[0], len(data))
+        langids = tuple(data[i] | (data[i + 1] << 8) for i in range(2, end - 1, 2))
+        self._langids[(device, self._generations.get(device, 0))] = langids
+        return langids
+    
+    def add_string(self, device, index, langid, data):
+        text = self.intern(data)
+        texts = self._strings.setdefault((device, self._generations.get(device, 0), index), {})
+        if langid not in texts:
+            self._count += 1
+        texts[langid] = text
+        return text
+    
+    def add_transfer(self, transfer):
+        """Record a reassembled GET_DESCRIPTOR(String) response; a device descriptor starts a new enumeration"""
+        device = transfer.key[:2]
+        if transfer.descriptor_type == DEVICE_DESCRIPTOR:
+            self.new_enumeration(device)
+            return
+        if transfer.descriptor_type != STRING_DESCRIPTOR or len(transfer.data) < 2:
+            return
+        if transfer.descriptor_index == 0:
+            self.add_langids(device, transfer.data)
+        else:
+            self.add_string(device, transfer.descriptor_index, transfer.language_id, transfer.data)
+    
+    def langids(self, device):
+        return self._langids.get((device, self._generations.get(device, 0)), ())
+    
+    def get(self, device, index, langid=None):
+        """Text for a string index, in langid or else the device's first language that has it"""
+        return self._lookup(device, self._generations.get(device, 0), index, langid)
+    
+    def _lookup(self, device, generation, index, langid):
+        texts = self._strings.get((device, generation, index))
+        if not texts:
+            return None
+        if langid is not None:
+            return texts.get(langid)
+        for candidate in self._langids.get((device, generation), ()):
+            text = texts.get(candidate)
+            if text is not None:
+                return text
+        # Fall back to any language, for captures that missed the LANGID request
+        return next(iter(texts.values()))
+    
+    def resolver(self, device, langid=None):
+        """Callable mapping a string index to text for one device, as taken by parse_descriptor"""
+        generation = self._generations.get(device, 0)
+        return lambda index: self._lookup(device, generation, index, langid)
+    
+    def format(self):
+        """One line per LANGID array and string, sorted by device, enumeration and index"""
+        def describe(device, generation):
+            # Later enumerations of a reused address are numbered
+            suffix = f" (enumeration {generation})" if generation > 1 else ""
+            return f"Bus {device[0]} Device {device[1]}{suffix}"
+        
+        output = []
+        for (device, generation) in sorted(self._langids):
+            languages = ", ".join(f"0x{langid:04X} ({get_language_name(langid)})"
+                                  for langid in self._langids[(device, generation)])
+            output.append(f"{describe(device, generation)} LANGIDs: {languages}")
+        for (device, generation, index) in sorted(self._strings):
+            texts = self._strings[(device, generation, index)]
+            for langid in sorted(texts):
+                output.append(f"{describe(device, generation)} string {index} [0x{langid:04X}]: {json.dumps(texts[langid])}")
+        return "\n".join(output)
+
+def decode_control_transfer(transfer, verbosity=VERBOSITY_EXPLAIN, strings=None):
+    """
+    Decode every descriptor in a reassembled GET_DESCRIPTOR response.
+    With a StringTable, string responses are added to it and string indexes
+    are resolved against it.
+    """
+    bus, device, endpoint = transfer.key
+    header = (f"Bus {bus} Device {device} EP{endpoint}: GET_DESCRIPTOR type 0x{transfer.descriptor_type:02X} "
+              f"index {transfer.descriptor_index} ({len(transfer.data)} of {transfer.requested_length} bytes)")
+    if transfer.descriptor_type == HID_REPORT_DESCRIPTOR:
+        # Report descriptors are item streams, not standard descriptors
+        return header + "\n" + bytes_to_display_string(transfer.data)
+    
+    resolve = None
+    if strings is not None:
+        strings.add_transfer(transfer)
+        resolve = strings.resolver(transfer.key[:2], transfer.language_id or None)
+    
+    output = [header]
+    try:
+        if transfer.descriptor_type == STRING_DESCRIPTOR:
+            output.append(parse_string_descriptor(transfer.data, verbosity, transfer.descriptor_index))
+        else:
+            output.append(parse_descriptor_set(transfer.data, verbosity, resolve))
+    except ValueError as e:
+        output.append(f"Error: {str(e)}")
+    return "\n".join(output)
+
+# Threaded reader -> decoder -> writer pipeline for files of hex descriptors
+PIPELINE_BATCH_SIZE = 64    # Descriptors handed between stages at a time
+PIPELINE_QUEUE_SIZE = 8     # Batches buffered between stages before backpressure applies
+
+def decode_hex_text(hex_string, verbosity=VERBOSITY_EXPLAIN):
+    """Decode descriptor bytes given as hex text, returning the text the GUI would show"""
+    try:
+        data = parse_hex_string(hex_string)
+    except ValueError as e:
+        record_input_error("invalid_hex")
+        return f"Error: {str(e)}"
+    return decode_descriptor_bytes(data, verbosity)
+
+class PipelineStageMetrics:
+    """Throughput, blocking time and output queue depth for one pipeline stage"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.batches = 0
+        self.elapsed = 0.0
+        self.get_blocked = 0.0   # Waiting for input from the previous stage
+        self.put_blocked = 0.0   # Waiting for room in the next stage's queue (backpressure)
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+    
+    def record_depth(self, depth):
+        self._depth_total += depth
+        self._depth_samples += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+    
+    @property
+    def mean_depth(self):
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+    
+    @property
+    def busy(self):
+        return max(0.0, self.elapsed - self.get_blocked - self.put_blocked)
+    
+    def format(self):
+        text = (f"{self.name}: {self.items} items in {self.batches} batches, {self.elapsed:.3f}s total, "
+                f"{self.busy:.3f}s busy, {self.get_blocked:.3f}s waiting for input, "
+                f"{self.put_blocked:.3f}s blocked on output")
+        if self._depth_samples:
+            text += f" (queue depth mean {self.mean_depth:.1f}, max {self.max_depth})"
+        return text
+
+def _pipeline_put(q, batch, metrics, stop):
+    """Put a batch (or the None end marker) on a bounded queue; returns False if the pipeline was stopped"""
+    start = time.perf_counter()
+    while True:
         try:
-            hex_string = self.input_text.toPlainText().strip()
-            if not hex_string:
-                self.output_text.setPlainText("Please enter descriptor data in hex format.")
+            q.put(batch, timeout=0.1)
+            break
+        except queue.Full:
+            if stop.is_set():
+                return False
+    metrics.put_blocked += time.perf_counter() - start
+    if batch is not None:
+        metrics.batches += 1
+        metrics.items += len(batch)
+        metrics.record_depth(q.qsize())
+    return True
+
+def _pipeline_get(q, metrics, stop):
+    """Take the next batch off a queue; returns None at the end marker or if the pipeline was stopped"""
+    start = time.perf_counter()
+    while True:
+        try:
+            batch = q.get(timeout=0.1)
+            break
+        except queue.Empty:
+            if stop.is_set():
+                batch = None
+                break
+    metrics.get_blocked += time.perf_counter() - start
+    return batch
+
+def run_decode_pipeline(input_path, output_path, verbosity=VERBOSITY_EXPLAIN,
+                        batch_size=PIPELINE_BATCH_SIZE, queue_size=PIPELINE_QUEUE_SIZE):
+    """
+    Decode a text file with one hex descriptor per line using reader, decoder
+    and writer threads joined by bounded queues, so file I/O overlaps with
+    decoding. Blank lines and lines starting with # are skipped.
+    Returns the PipelineStageMetrics for the reader, decoder and writer.
+    """
+    if batch_size < 1 or queue_size < 1:
+        raise ValueError("Batch size and queue size must be at least 1")
+    decode_queue = queue.Queue(maxsize=queue_size)
+    write_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors = []
+    reader_metrics = PipelineStageMetrics("reader")
+    decoder_metrics = PipelineStageMetrics("decoder")
+    writer_metrics = PipelineStageMetrics("writer")
+    
+    def reader():
+        with open(input_path, 'r', encoding='utf-8', errors='replace') as f:
+            batch = []
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                batch.append((line_number, line))
+                if len(batch) >= batch_size:
+                    if not _pipeline_put(decode_queue, batch, reader_metrics, stop):
+                        return
+                    batch = []
+            if batch and not _pipeline_put(decode_queue, batch, reader_metrics, stop):
+                return
+        _pipeline_put(decode_queue, None, reader_metrics, stop)
+    
+    def decoder():
+        while True:
+            batch = _pipeline_get(decode_queue, decoder_metrics, stop)
+            if batch is None:
+                break
+            results = [(line_number, decode_hex_text(text, verbosity)) for line_number, text in batch]
+            if not _pipeline_put(write_queue, results, decoder_metrics, stop):
                 return
+        _pipeline_put(write_queue, None, decoder_metrics, stop)
+    
+    def writer():
+        with open(output_path, 'w', encoding='utf-8') as out:
+            while True:
+                batch = _pipeline_get(write_queue, writer_metrics, stop)
+                if batch is None:
+                    break
+                if verbosity == VERBOSITY_TERSE:
+                    out.write("".join(f"{line_number}: {text}\n" for line_number, text in batch))
+                else:
+                    out.write("".join(f"=== line {line_number} ===\n{text}\n\n" for line_number, text in batch))
+                writer_metrics.batches += 1
+                writer_metrics.items += len(batch)
+    
+    def run_stage(stage, metrics):
+        start = time.perf_counter()
+        try:
+            stage()
+        except BaseException as e:
+            # Stop the other stages rather than leaving them blocked on a queue
+            errors.append(e)
+            stop.set()
+        finally:
+            metrics.elapsed = time.perf_counter() - start
+    
+    threads = [
+        threading.Thread(target=run_stage, args=(reader, reader_metrics), name="pipeline-reader", daemon=True),
+        threading.Thread(target=run_stage, args=(decoder, decoder_metrics), name="pipeline-decoder", daemon=True),
+        threading.Thread(target=run_stage, args=(writer, writer_metrics), name="pipeline-writer", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return [reader_metrics, decoder_metrics, writer_metrics]
+
+def _run_gui(qt_args):
+    """
+    Start the GUI. PyQt6 is only imported here, so the batch modes (and their
+    worker processes) run with nothing but the standard library.
+    """
+    from PyQt6.QtWidgets import (
+        QApplication, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
+        QLabel, QTextEdit, QFileDialog, QComboBox, QMessageBox,
+        QSplitter, QMainWindow, QToolBar, QStatusBar, QCheckBox
+    )
+    from PyQt6.QtCore import Qt, QSettings, QSize
+    from PyQt6.QtGui import QPalette, QColor, QAction, QIcon, QFont
+    
+    class USBDecoderApp(QMainWindow):
+        def __init__(self):
+            super().__init__()
+            
+            self.setWindowTitle("USB Descriptor Decoder")
+            self.setMinimumSize(1000, 600)
+            
+            # Create main widget and layout
+            self.main_widget = QWidget()
+            self.setCentralWidget(self.main_widget)
+            self.main_layout = QVBoxLayout(self.main_widget)
+            
+            # Create splitter for input/output
+            self.splitter = QSplitter(Qt.Orientation.Horizontal)
+            self.main_layout.addWidget(self.splitter)
+            
+            # Input panel
+            self.input_widget = QWidget()
+            self.input_layout = QVBoxLayout(self.input_widget)
+            
+            self.input_label = QLabel("Enter USB descriptor bytes as hex:")
+            self.input_layout.addWidget(self.input_label)
+            
+            self.input_text = QTextEdit()
+            self.input_text.setPlaceholderText("Example: 12 01 00 02 00 00 00 40 5E 04 3D 00 01 02 01 02 00 01")
+            self.input_layout.addWidget(self.input_text)
+            
+            # Descriptor type selector
+            self.descriptor_type_layout = QHBoxLayout()
+            self.descriptor_type_label = QLabel("Descriptor Type:")
+            self.descriptor_type_combo = QComboBox()
+            self.descriptor_type_combo.addItem("Auto-detect", -1)
+            self.descriptor_type_combo.addItem("Device", DEVICE_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("Configuration", CONFIG_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("String", STRING_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("Interface", INTERFACE_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("Endpoint", ENDPOINT_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("HID", HID_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("BOS", BOS_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("Interface Association", IAD_DESCRIPTOR)
+            self.descriptor_type_combo.addItem("DFU Functional", DFU_DESCRIPTOR)
+            
+            self.descriptor_type_layout.addWidget(self.descriptor_type_label)
+            self.descriptor_type_layout.addWidget(self.descriptor_type_combo)
+            self.input_layout.addLayout(self.descriptor_type_layout)
+            
+            self.decode_button = QPushButton("Decode")
+            self.decode_button.clicked.connect(self.decode_descriptor)
+            self.input_layout.addWidget(self.decode_button)
+            
+            self.load_file_button = QPushButton("Load from File")
+            self.load_file_button.clicked.connect(self.load_from_file)
+            self.input_layout.addWidget(self.load_file_button)
+            
+            # Output panel
+            self.output_widget = QWidget()
+            self.output_layout = QVBoxLayout(self.output_widget)
             
-            data = parse_hex_string(hex_string)
-            if len(data) < 2:
-                self.output_text.setPlainText("Descriptor data is too short.")
+            self.output_label = QLabel("Decoded Descriptor:")
+            self.output_layout.addWidget(self.output_label)
+            
+            self.output_text = QTextEdit()
+            self.output_text.setReadOnly(True)
+            self.output_layout.addWidget(self.output_text)
+            
+            self.copy_button = QPushButton("Copy to Clipboard")
+            self.copy_button.clicked.connect(self.copy_to_clipboard)
+            self.output_layout.addWidget(self.copy_button)
+            
+            # Add widgets to splitter
+            self.splitter.addWidget(self.input_widget)
+            self.splitter.addWidget(self.output_widget)
+            self.splitter.setSizes([400, 600])
+            
+            # Status bar
+            self.status_bar = QStatusBar()
+            self.setStatusBar(self.status_bar)
+            
+            # Create toolbar
+            self.toolbar = QToolBar("Main Toolbar")
+            self.addToolBar(self.toolbar)
+            
+            # Add actions to toolbar
+            self.clear_action = QAction("Clear All", self)
+            self.clear_action.triggered.connect(self.clear_all)
+            self.toolbar.addAction(self.clear_action)
+            
+            self.about_action = QAction("About", self)
+            self.about_action.triggered.connect(self.show_about)
+            self.toolbar.addAction(self.about_action)
+            
+            # Set dark theme option
+            self.dark_theme_check = QCheckBox("Dark Theme")
+            self.dark_theme_check.stateChanged.connect(self.toggle_theme)
+            self.toolbar.addWidget(self.dark_theme_check)
+            
+            # Load settings
+            self.settings = QSettings("USBDecoder", "USBDecoderApp")
+            self.load_settings()
+            
+            # Show a welcome message
+            self.output_text.setPlainText("Welcome to the USB Descriptor Decoder!\n\n"
+                                         "Enter USB descriptor bytes in hex format, then click 'Decode'.\n\n"
+                                         "Examples:\n"
+                                         "- Device Descriptor: 12 01 00 02 00 00 00 40 5E 04 3D 00 01 02 01 02 00 01\n"
+                                         "- Config Descriptor: 09 02 20 00 01 01 00 80 32\n"
+                                         "- Interface Descriptor: 09 04 00 00 02 08 06 50 00\n\n"
+                                         "Tip: When analyzing USB devices with Packetry or Wireshark, copy the descriptor bytes here for detailed information.")
+            
+        def decode_descriptor(self):
+            try:
+                hex_string = self.input_text.toPlainText().strip()
+                if not hex_string:
+                    self.output_text.setPlainText("Please enter descriptor data in hex format.")
+                    return
+                
+                data = parse_hex_string(hex_string)
+                
+                descriptor_type_index = self.descriptor_type_combo.currentIndex()
+                if descriptor_type_index != 0 and len(data) >= 2:
+                    # Override the descriptor type if manually selected
+                    descriptor_type = self.descriptor_type_combo.currentData()
+                    if data[1] != descriptor_type:
+                        # Create a new data array with the selected descriptor type
+                        new_data = bytearray(data)
+                        new_data[1] = descriptor_type
+                        data = bytes(new_data)
+                result = decode_descriptor_bytes(data)
+                
+                # Display the result
+                self.output_text.setPlainText(result)
+                if result.startswith("Error:"):
+                    self.status_bar.showMessage("Error decoding descriptor", 3000)
+                elif len(data) >= 2:
+                    self.status_bar.showMessage("Descriptor decoded successfully!", 3000)
+            except Exception as e:
+                self.output_text.setPlainText(f"Error: {str(e)}")
+                self.status_bar.showMessage("Error decoding descriptor", 3000)
+        
+        def load_from_file(self):
+            file_name, _ = QFileDialog.getOpenFileName(
+                self, "Open Binary File", "", "All Files (*);;Binary Files (*.bin);;Text Files (*.txt)"
+            )
+            
+            if not file_name:
                 return
             
-            descriptor_type_index = self.descriptor_type_combo.currentIndex()
-            if descriptor_type_index == 0:  # Auto-detect
-                result = parse_descriptor(data)
+            try:
+                data = load_descriptor_file(file_name)
+                
+                # Display the hex representation in the input field
+                hex_str = bytes_to_display_string(data)
+                self.input_text.setPlainText(hex_str)
+                
+                # Try to decode
+                self.decode_descriptor()
+                
+            except Exception as e:
+                self.output_text.setPlainText(f"Error loading file: {str(e)}")
+                self.status_bar.showMessage("Error loading file", 3000)
+        
+        def copy_to_clipboard(self):
+            clipboard = QApplication.clipboard()
+            clipboard.setText(self.output_text.toPlainText())
+            self.status_bar.showMessage("Copied to clipboard!", 2000)
+        
+        def clear_all(self):
+            self.input_text.clear()
+            self.output_text.clear()
+            self.descriptor_type_combo.setCurrentIndex(0)
+            self.status_bar.showMessage("Cleared all fields", 2000)
+        
+        def show_about(self):
+            QMessageBox.about(self, "About USB Descriptor Decoder",
+                              "USB Descriptor Decoder v2.0\n\n"
+                              "A tool to decode USB descriptor bytes into human-readable format.\n\n"
+                              "Useful for USB developers, security researchers, and anyone working with low-level USB protocols.\n\n"
+                              "This tool helps decode standard USB descriptors including:\n"
+                              "- Device descriptors\n"
+                              "- Configuration descriptors\n"
+                              "- Interface descriptors\n"
+                              "- Endpoint descriptors\n"
+                              "- HID descriptors\n"
+                              "- And more specialized descriptor types\n\n"
+                              "For use with Cynthion, Packetry, Wireshark, or any USB analysis tools.")
+        
+        def toggle_theme(self, state):
+            if state == Qt.CheckState.Checked.value:
+                self.apply_dark_theme()
             else:
-                # Override the descriptor type if manually selected
-                descriptor_type = self.descriptor_type_combo.currentData()
-                if data[1] != descriptor_type:
-                    # Create a new data array with the selected descriptor type
-                    new_data = bytearray(data)
-                    new_data[1] = descriptor_type
-                    data = bytes(new_data)
-                result = parse_descriptor(data)
-            
-            # Display the result
-            self.output_text.setPlainText(result)
-            self.status_bar.showMessage("Descriptor decoded successfully!", 3000)
-        except Exception as e:
-            self.output_text.setPlainText(f"Error: {str(e)}")
-            self.status_bar.showMessage("Error decoding descriptor", 3000)
-    
-    def load_from_file(self):
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "Open Binary File", "", "All Files (*);;Binary Files (*.bin);;Text Files (*.txt)"
-        )
-        
-        if not file_name:
-            return
+                self.apply_light_theme()
+            
+            # Save the setting
+            self.settings.setValue("dark_theme", state == Qt.CheckState.Checked.value)
         
-        try:
-            with open(file_name, 'rb') as f:
-                data = f.read()
+        def apply_dark_theme(self):
+            dark_palette = QPalette()
+            dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
+            dark_palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
+            dark_palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
+            dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
+            dark_palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
+            dark_palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.white)
+            dark_palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
+            dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+            dark_palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
+            dark_palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
+            dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
+            dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+            dark_palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
             
-            # If it's a text file, try to parse it as hex
-            if file_name.lower().endswith('.txt'):
-                with open(file_name, 'r') as f:
-                    text_data = f.read()
-                try:
-                    data = parse_hex_string(text_data)
-                except ValueError:
-                    # If parsing as hex fails, use the binary data anyway
-                    pass
-            
-            # Display the hex representation in the input field
-            hex_str = bytes_to_display_string(data)
-            self.input_text.setPlainText(hex_str)
-            
-            # Try to decode
-            self.decode_descriptor()
-            
-        except Exception as e:
-            self.output_text.setPlainText(f"Error loading file: {str(e)}")
-            self.status_bar.showMessage("Error loading file", 3000)
-    
-    def copy_to_clipboard(self):
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.output_text.toPlainText())
-        self.status_bar.showMessage("Copied to clipboard!", 2000)
-    
-    def clear_all(self):
-        self.input_text.clear()
-        self.output_text.clear()
-        self.descriptor_type_combo.setCurrentIndex(0)
-        self.status_bar.showMessage("Cleared all fields", 2000)
-    
-    def show_about(self):
-        QMessageBox.about(self, "About USB Descriptor Decoder",
-                          "USB Descriptor Decoder v2.0\n\n"
-                          "A tool to decode USB descriptor bytes into human-readable format.\n\n"
-                          "Useful for USB developers, security researchers, and anyone working with low-level USB protocols.\n\n"
-                          "This tool helps decode standard USB descriptors including:\n"
-                          "- Device descriptors\n"
-                          "- Configuration descriptors\n"
-                          "- Interface descriptors\n"
-                          "- Endpoint descriptors\n"
-                          "- HID descriptors\n"
-                          "- And more specialized descriptor types\n\n"
-                          "For use with Cynthion, Packetry, Wireshark, or any USB analysis tools.")
-    
-    def toggle_theme(self, state):
-        if state == Qt.CheckState.Checked.value:
-            self.apply_dark_theme()
-        else:
-            self.apply_light_theme()
-        
-        # Save the setting
-        self.settings.setValue("dark_theme", state == Qt.CheckState.Checked.value)
-    
-    def apply_dark_theme(self):
-        dark_palette = QPalette()
-        dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-        dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-        dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
-        
-        QApplication.setPalette(dark_palette)
-        
-        # Set stylesheet for additional elements
-        self.setStyleSheet("""
-            QToolTip { color: #ffffff; background-color: #2a82da; border: 1px solid white; }
-            QTextEdit { background-color: #1e1e1e; color: #f0f0f0; }
-        """)
-    
-    def apply_light_theme(self):
-        QApplication.setPalette(QApplication.style().standardPalette())
-        self.setStyleSheet("")
-    
-    def load_settings(self):
-        # Load window geometry
-        geometry = self.settings.value("geometry")
-        if geometry:
-            self.restoreGeometry(geometry)
-        
-        # Load dark theme setting
-        dark_theme = self.settings.value("dark_theme", False, type=bool)
-        self.dark_theme_check.setChecked(dark_theme)
-        if dark_theme:
-            self.apply_dark_theme()
-    
-    def save_settings(self):
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("dark_theme", self.dark_theme_check.isChecked())
-    
-    def closeEvent(self, event):
-        self.save_settings()
-        super().closeEvent(event)
-
-def main():
-    app = QApplication(sys.argv)
+            QApplication.setPalette(dark_palette)
+            
+            # Set stylesheet for additional elements
+            self.setStyleSheet("""
+                QToolTip { color: #ffffff; background-color: #2a82da; border: 1px solid white; }
+                QTextEdit { background-color: #1e1e1e; color: #f0f0f0; }
+            """)
+        
+        def apply_light_theme(self):
+            QApplication.setPalette(QApplication.style().standardPalette())
+            self.setStyleSheet("")
+        
+        def load_settings(self):
+            # Load window geometry
+            geometry = self.settings.value("geometry")
+            if geometry:
+                self.restoreGeometry(geometry)
+            
+            # Load dark theme setting
+            dark_theme = self.settings.value("dark_theme", False, type=bool)
+            self.dark_theme_check.setChecked(dark_theme)
+            if dark_theme:
+                self.apply_dark_theme()
+        
+        def save_settings(self):
+            self.settings.setValue("geometry", self.saveGeometry())
+            self.settings.setValue("dark_theme", self.dark_theme_check.isChecked())
+        
+        def closeEvent(self, event):
+            self.save_settings()
+            super().closeEvent(event)
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle("Fusion")  # Use Fusion style for better cross-platform experience
     
     # Set application-wide font
@@ -865,5 +3014,138 @@ def main():
     window.show()
     sys.exit(app.exec())
 
+def run_headless(args, parser, metrics=None):
+    """Run the batch mode selected on the command line; returns False if none was selected"""
+    if args.decode_dir:
+        if not args.output:
+            parser.error("--decode-dir requires --output")
+        try:
+            count = decode_capture_directory(args.decode_dir, args.output, args.checkpoint, args.workers,
+                                             verbosity=args.verbosity, metrics=metrics)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Decoded {count} files into {args.output}")
+        return True
+    
+    if args.pipeline:
+        if not args.output:
+            parser.error("--pipeline requires --output")
+        stage_metrics = run_decode_pipeline(args.pipeline, args.output, args.verbosity, args.batch_size, args.queue_size)
+        for stage in stage_metrics:
+            print(stage.format(), file=sys.stderr)
+        return True
+    
+    if args.follow:
+        out = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+        try:
+            for text in follow_usbmon_log(args.follow, args.verbosity, args.from_start, idle_timeout=args.idle_exit):
+                out.write(text + "\n\n")
+                out.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        return True
+    
+    if args.reassemble:
+        out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            strings = None
+            if args.strings:
+                # Strings are usually requested after the descriptors that reference them,
+                # so collect them in a first pass
+                strings = StringTable()
+                with open(args.reassemble, 'rb') as f:
+                    for transfer in reassemble_control_transfers(iter_capture_events(f)):
+                        strings.add_transfer(transfer)
+                strings.rewind()
+            with open(args.reassemble, 'rb') as f:
+                for transfer in reassemble_control_transfers(iter_capture_events(f)):
+                    out.write(decode_control_transfer(transfer, args.verbosity, strings) + "\n\n")
+            if strings is not None:
+                out.write(strings.format() + "\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        return True
+    
+    if args.bandwidth:
+        out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            for file_name in args.bandwidth:
+                try:
+                    tables = get_streaming_tables(bytes(load_descriptor_file(file_name)), args.speed)
+                    text = format_streaming_tables(tables) or "No streaming interfaces"
+                except (OSError, ValueError) as e:
+                    text = f"Error: {str(e)}"
+                out.write(f"=== {file_name} ===\n{text}\n\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        return True
+    
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description="USB Descriptor Decoder")
+    parser.add_argument("--decode-dir", metavar="DIR",
+                        help="decode every capture file under DIR without starting the GUI")
+    parser.add_argument("--output", metavar="FILE", help="file to write batch output to")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                        help="checkpoint manifest for resuming (default: OUTPUT.checkpoint.json)")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="number of worker processes (default: number of available CPUs)")
+    parser.add_argument("--verbosity", choices=VERBOSITY_LEVELS, default=VERBOSITY_EXPLAIN,
+                        help="terse: one key=value line per descriptor, normal: fields without notes, "
+                             "explain: fields with notes (default)")
+    parser.add_argument("--reassemble", metavar="CAPTURE",
+                        help="reassemble and decode GET_DESCRIPTOR responses from a pcap or usbmon text capture")
+    parser.add_argument("--strings", action="store_true",
+                        help="with --reassemble, resolve string indexes to text and list the string table")
+    parser.add_argument("--pipeline", metavar="FILE",
+                        help="decode a text file with one hex descriptor per line using a threaded pipeline")
+    parser.add_argument("--batch-size", type=int, default=PIPELINE_BATCH_SIZE, metavar="N",
+                        help=f"with --pipeline, descriptors per batch (default: {PIPELINE_BATCH_SIZE})")
+    parser.add_argument("--queue-size", type=int, default=PIPELINE_QUEUE_SIZE, metavar="N",
+                        help=f"with --pipeline, batches buffered between stages (default: {PIPELINE_QUEUE_SIZE})")
+    parser.add_argument("--follow", metavar="LOG",
+                        help="follow a usbmon text log (including across rotation) and decode descriptors as they appear")
+    parser.add_argument("--from-start", action="store_true",
+                        help="with --follow, decode the existing contents of the log before following it")
+    parser.add_argument("--idle-exit", type=float, metavar="SECONDS",
+                        help="with --follow, stop once the log has not grown for SECONDS")
+    parser.add_argument("--bandwidth", nargs="+", metavar="FILE",
+                        help="list the UVC/UAC formats and per-alt-setting bandwidth of configuration descriptor files")
+    parser.add_argument("--speed", choices=sorted(USB_SPEED_INTERVALS), default="high",
+                        help="with --bandwidth, bus speed the device runs at (default: high)")
+    parser.add_argument("--metrics-file", metavar="FILE",
+                        help="write Prometheus text-format decode metrics to FILE during batch runs")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="serve Prometheus decode metrics on 127.0.0.1:PORT during batch runs")
+    parser.add_argument("--metrics-interval", type=float, default=METRICS_WRITE_INTERVAL, metavar="SECONDS",
+                        help=f"how often --metrics-file is rewritten (default: {METRICS_WRITE_INTERVAL:g})")
+    args, qt_args = parser.parse_known_args()
+    
+    metrics = None
+    close_metrics_file = None
+    if args.metrics_file or args.metrics_port:
+        metrics = MetricsRegistry()
+        enable_metrics(metrics)
+        if args.metrics_port:
+            metrics.serve(args.metrics_port)
+        if args.metrics_file:
+            close_metrics_file = metrics.start_file_writer(args.metrics_file, args.metrics_interval)
+    try:
+        if run_headless(args, parser, metrics):
+            return
+    finally:
+        if close_metrics_file is not None:
+            close_metrics_file()
+    
+    _run_gui(qt_args)
+
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds start worker processes by relaunching the app
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file